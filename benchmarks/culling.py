@@ -0,0 +1,48 @@
+"""
+Compares drawing number planes of growing size through MovingCamera and through CullingMovingCamera
+from lib/CullingCamera, with the camera frame fixed at its default size, and checks the frames
+come out pixel for pixel the same. With culling, the time per frame should stay about flat as
+the plane grows past the frame.
+
+Run from the repository root with:
+```
+python -m benchmarks.culling [--sizes 4 8 16 32] [--frames 20]
+```
+"""
+import argparse
+import time
+
+import numpy as np
+from manim import *
+
+from lib.CullingCamera import CullingMovingCamera
+
+def render(camera_class, size: int, frames: int) -> tuple[float, int, np.ndarray]:
+    plane = NumberPlane(x_range=[ -size, size ], y_range=[ -size, size ]).rotate(PI / 12)
+    camera = camera_class()
+    drawn = len(camera.get_mobjects_to_display([ plane ]))
+    start = time.perf_counter()
+    for _ in range(frames):
+        camera.reset()
+        camera.capture_mobjects([ plane ])
+    seconds = ( time.perf_counter() - start ) / frames
+    return seconds, drawn, camera.pixel_array.copy()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[ 4, 8, 16, 32 ])
+    parser.add_argument("--frames", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'plane':>7} {'drawn':>11} {'full (ms)':>10} {'culled (ms)':>12} {'speedup':>9} {'identical':>10}")
+    for size in args.sizes:
+        full, total, full_pixels = render(MovingCamera, size, args.frames)
+        culled, drawn, culled_pixels = render(CullingMovingCamera, size, args.frames)
+        identical = np.array_equal(full_pixels, culled_pixels)
+        print(
+            f"{f'{2 * size}x{2 * size}':>7} {f'{drawn}/{total}':>11} {full * 1e3:>10.1f} {culled * 1e3:>12.1f}"
+            f" {full / culled:>8.1f}x {str(identical):>10}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Compares building stock Arrow3Ds with lod_arrow3d from lib/lod at each render quality, reporting
+the faces per arrow and the time to build the basis arrows of the ThreeD scenes, the first time
+(tessellating) and again (copying cached meshes).
+
+Run from the repository root with:
+```
+python -m benchmarks.lod [--qualities low_quality medium_quality high_quality fourk_quality]
+```
+"""
+import argparse
+import time
+
+from manim import *
+
+from lib.lod import _arrow_meshes, lod_arrow3d
+
+def build_basis(make) -> tuple[float, int]:
+    start = time.perf_counter()
+    arrows = [ make(ORIGIN, RIGHT, color=RED), make(ORIGIN, UP, color=GREEN), make(ORIGIN, OUT, color=BLUE) ]
+    seconds = time.perf_counter() - start
+    return seconds, len(arrows[0].family_members_with_points())
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--qualities", nargs="+", default=[ "low_quality", "medium_quality", "high_quality", "fourk_quality" ])
+    args = parser.parse_args()
+
+    print(f"{'quality':<15} {'stock faces':>12} {'stock (ms)':>11} {'lod faces':>10} {'lod (ms)':>9} {'cached (ms)':>12}")
+    for quality in args.qualities:
+        with tempconfig({ "quality": quality }):
+            stock, stock_faces = build_basis(Arrow3D)
+            _arrow_meshes.clear()
+            first, faces = build_basis(lod_arrow3d)
+            cached, _ = build_basis(lod_arrow3d)
+        print(f"{quality:<15} {stock_faces:>12} {stock * 1e3:>11.0f} {faces:>10} {first * 1e3:>9.0f} {cached * 1e3:>12.1f}")
+
+if __name__ == "__main__":
+    main()
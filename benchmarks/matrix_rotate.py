@@ -0,0 +1,64 @@
+"""
+Compares Rotate with MatrixRotate from lib/MatrixRotate on number planes of growing size.
+
+For each, reports the time per frame, the memory the animation holds after begin (Rotate's
+copies of the mobject, MatrixRotate's buffers) and the peak memory allocated while drawing a
+frame, which is what Rotate's per-frame temporaries cost in memory traffic. Memory is measured
+with tracemalloc, which sees numpy's allocations.
+
+Run from the repository root with:
+```
+python -m benchmarks.matrix_rotate [--sizes 5 10 20] [--frames 30]
+```
+"""
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+from manim import *
+
+from lib.MatrixRotate import MatrixRotate
+
+def measure(animation_class, size: int, frames: int) -> dict:
+    plane = NumberPlane(x_range=[ -size, size ], y_range=[ -size, size ])
+    points = sum( len(mob.points) for mob in plane.family_members_with_points() )
+    animation = animation_class(plane, PI / 3, RIGHT, ORIGIN)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    animation.begin()
+    held = tracemalloc.get_traced_memory()[0] - before
+
+    frame_peak = 0
+    for t in np.linspace(0, 1, frames):
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        animation.interpolate(t)
+        frame_peak = max(frame_peak, tracemalloc.get_traced_memory()[1] - current)
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for t in np.linspace(0, 1, frames):
+        animation.interpolate(t)
+    seconds = ( time.perf_counter() - start ) / frames
+    animation.finish()
+    return { "points": points, "seconds": seconds, "held": held, "frame_peak": frame_peak }
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[ 5, 10, 20 ])
+    parser.add_argument("--frames", type=int, default=30)
+    args = parser.parse_args()
+
+    print(f"{'plane':>7} {'points':>8} {'animation':<13} {'frame (ms)':>11} {'held (KB)':>10} {'frame peak (KB)':>16}")
+    for size in args.sizes:
+        for animation_class in [ Rotate, MatrixRotate ]:
+            result = measure(animation_class, size, args.frames)
+            print(
+                f"{f'{2 * size}x{2 * size}':>7} {result['points']:>8} {animation_class.__name__:<13} {result['seconds'] * 1e3:>11.2f}"
+                f" {result['held'] / 1024:>10.0f} {result['frame_peak'] / 1024:>16.1f}"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Compares the scalar and batch quaternion helpers in lib/mathutils.
+
+Run from the repository root with:
+```
+python -m benchmarks.quaternions [--max-n 1000000] [--max-scalar-n 100000]
+```
+"""
+import argparse
+import time
+
+import numpy as np
+
+from lib.mathutils import (
+    relative_quaternion, relative_quaternions,
+    rotate_vec_by_quat, rotate_vecs_by_quats, rotate_points_by_quat,
+)
+
+def random_unit(rng, n, size):
+    result = rng.normal(size=(n, size))
+    return result / np.linalg.norm(result, axis=-1, keepdims=True)
+
+def best_time(func, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max-n", type=int, default=10**6)
+    parser.add_argument("--max-scalar-n", type=int, default=10**5, help="The scalar path is skipped above this size.")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    sizes = [ n for n in [ 10**k for k in range(7) ] if n <= args.max_n ]
+
+    print(f"{'N':>8} {'case':<28} {'scalar (s)':>12} {'batch (s)':>12} {'speedup':>9}")
+    for n in sizes:
+        vecs = random_unit(rng, n, 3)
+        targets = random_unit(rng, n, 3)
+        quats = random_unit(rng, n, 4)
+        run_scalar = n <= args.max_scalar_n
+
+        cases = [
+            ( "rotate (N quats)",
+                lambda: [ rotate_vec_by_quat(v, q) for v, q in zip(vecs, quats) ],
+                lambda: rotate_vecs_by_quats(vecs, quats) ),
+            ( "rotate (1 quat, matrix)",
+                lambda: [ rotate_vec_by_quat(v, quats[0]) for v in vecs ],
+                lambda: rotate_points_by_quat(vecs, quats[0]) ),
+            ( "relative_quaternion",
+                lambda: [ relative_quaternion(v, t) for v, t in zip(vecs, targets) ],
+                lambda: relative_quaternions(vecs, targets) ),
+        ]
+        for name, scalar, batch in cases:
+            batch_time = best_time(batch)
+            if run_scalar:
+                scalar_time = best_time(scalar, repeat=1 if n >= 10**4 else 3)
+                print(f"{n:>8} {name:<28} {scalar_time:>12.6f} {batch_time:>12.6f} {scalar_time / batch_time:>8.1f}x")
+            else:
+                print(f"{n:>8} {name:<28} {'-':>12} {batch_time:>12.6f} {'-':>9}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Compares interpolating simultaneous Rotates and `.animate.scale` calls one by one, the way
+Scene does, with FusedTransforms from lib/FusedTransformScene, and checks the points match bit
+for bit on every frame.
+
+Run from the repository root with:
+```
+python -m benchmarks.rotations [--counts 1 10 100] [--frames 60]
+```
+"""
+import argparse
+import time
+
+import numpy as np
+from manim import *
+
+from lib.FusedTransformScene import FusedTransforms
+
+def build(case: str, count: int) -> tuple[list, list]:
+    mobjects = [
+        Arrow(ORIGIN, RIGHT + 0.5 * UP, buff=0).shift(index * 0.05 * DOWN).set_color(interpolate_color(BLUE, RED, index / max(count - 1, 1)))
+        for index in range(count)
+    ]
+    if case == "rotate":
+        animations = [ Rotate(mob, PI / 3, about_point=mob.get_start()) for mob in mobjects ]
+    else:
+        animations = [ mob.animate.scale(0.5, about_point=ORIGIN).build() for mob in mobjects ]
+    for animation in animations:
+        animation.begin()
+    return mobjects, animations
+
+def snapshot(mobjects: list) -> list:
+    return [ submob.points.copy() for mob in mobjects for submob in mob.family_members_with_points() ]
+
+def interpolate_separately(animations: list, t: float):
+    for animation in animations:
+        animation.interpolate(t / animation.run_time)
+
+def check_identical(case: str, count: int, times: np.ndarray) -> bool:
+    separate_mobjects, separate_animations = build(case, count)
+    fused_mobjects, fused_animations = build(case, count)
+    fused = FusedTransforms(fused_animations)
+    for t in times:
+        interpolate_separately(separate_animations, t)
+        fused.interpolate(t)
+        if not all( np.array_equal(a, b) for a, b in zip(snapshot(separate_mobjects), snapshot(fused_mobjects)) ):
+            return False
+    return bool(fused.groups) and not fused.separately
+
+def best_time(case: str, count: int, times: np.ndarray, fused: bool, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        _, animations = build(case, count)
+        step = FusedTransforms(animations).interpolate if fused else lambda t: interpolate_separately(animations, t)
+        start = time.perf_counter()
+        for t in times:
+            step(t)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--counts", type=int, nargs="+", default=[ 1, 10, 100 ])
+    parser.add_argument("--frames", type=int, default=60)
+    args = parser.parse_args()
+
+    times = np.linspace(0, 1, args.frames)
+    print(f"{'N':>5} {'case':<8} {'separate (ms)':>14} {'fused (ms)':>11} {'speedup':>9} {'identical':>10}")
+    for count in args.counts:
+        for case in [ "rotate", "scale" ]:
+            separate = best_time(case, count, times, False)
+            fused = best_time(case, count, times, True)
+            identical = check_identical(case, count, times)
+            print(f"{count:>5} {case:<8} {separate * 1e3:>14.1f} {fused * 1e3:>11.1f} {separate / fused:>8.1f}x {str(identical):>10}")
+
+if __name__ == "__main__":
+    main()
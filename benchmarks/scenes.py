@@ -0,0 +1,221 @@
+"""
+Renders scenes at a fixed quality and records where the time goes, play by play.
+
+For every scene the report holds its wall time split into construct (scene code between plays),
+update (animation interpolation and updaters), render (rasterizing frames) and encode (writing
+frames to ffmpeg and waiting on it), plus frames per second, peak RSS and how many times LaTeX
+ran. The same split is kept for each play() call. Each scene runs alone in a fresh process, and
+manim's partial movie caching is turned off so every play is really rendered.
+
+Run from the repository root with:
+```
+python -m benchmarks.scenes run complex.py quaternions.py -o before.json [--scenes DualPlanes] [-q l] [--cold]
+python -m benchmarks.scenes compare before.json after.json [--threshold 0.1]
+```
+`--cold` renders with an empty media directory, so the tex caches start cold.
+`compare` exits with status 1 when anything regressed by more than the threshold.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import manim.utils.tex_file_writing as tex_file_writing
+from manim import *
+
+from lib.batchrender import QUALITIES, RenderJob, find_jobs, load_job_scene
+
+PHASES = [ "construct", "update", "render", "encode" ]
+# Changes under these are noise, whatever their relative size.
+MIN_SECONDS = 0.05
+MIN_RSS_MB = 10
+
+class Timer:
+    """Accumulates the time spent in wrapped methods."""
+    def __init__(self):
+        self.totals = {}
+
+    def wrap(self, obj, method_name: str, phase: str):
+        method = getattr(obj, method_name)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.totals[phase] = self.totals.get(phase, 0) + time.perf_counter() - start
+
+        setattr(obj, method_name, timed)
+
+    def get(self, phase: str) -> float:
+        return self.totals.get(phase, 0)
+
+def count_tex_runs(counter: list):
+    compile_tex = tex_file_writing.compile_tex
+
+    def counted(tex_file, tex_compiler, output_format):
+        if not tex_file.with_suffix(output_format).exists():
+            counter[0] += 1
+        return compile_tex(tex_file, tex_compiler, output_format)
+
+    tex_file_writing.compile_tex = counted
+
+def instrument(scene: Scene, plays: list, tex_runs: list) -> Timer:
+    renderer = scene.renderer
+    timer = Timer()
+    timer.wrap(renderer, "update_frame", "render")
+    timer.wrap(renderer, "add_frame", "encode")
+    timer.wrap(renderer.file_writer, "end_animation", "encode")
+    play = renderer.play
+
+    def timed_play(scene, *args, **kwargs):
+        before = dict(timer.totals)
+        frames_before = renderer.time * config.frame_rate
+        tex_before = tex_runs[0]
+        start = time.perf_counter()
+        play(scene, *args, **kwargs)
+        wall = time.perf_counter() - start
+        frames = round(renderer.time * config.frame_rate - frames_before)
+        record = {
+            "index": len(plays),
+            "animations": ", ".join( type(animation).__name__ for animation in scene.animations or [] ),
+            "wall": wall,
+            "frames": frames,
+            "fps": frames / wall if wall > 0 else 0,
+            "tex_runs": tex_runs[0] - tex_before,
+        }
+        for phase in [ "render", "encode" ]:
+            record[phase] = timer.get(phase) - before.get(phase, 0)
+        record["update"] = wall - record["render"] - record["encode"]
+        plays.append(record)
+
+    renderer.play = timed_play
+    return timer
+
+def benchmark_job(job: RenderJob, quality: str, cold: bool) -> dict:
+    """Runs in a fresh worker process."""
+    if cold:
+        config.media_dir = tempfile.mkdtemp(prefix="manim-benchmark-")
+        os.environ["MANIM_TEX_GEOMETRY_CACHE"] = os.path.join(config.media_dir, "tex_geometry")
+    config.disable_caching = True
+    config.progress_bar = "none"
+    os.environ.pop("MANIM_RESUME_FROM", None)
+
+    tex_runs = [ 0 ]
+    count_tex_runs(tex_runs)
+    plays = []
+    scene_class = load_job_scene(job, quality)
+    start = time.perf_counter()
+    scene = scene_class()
+    timer = instrument(scene, plays, tex_runs)
+    scene.render()
+    wall = time.perf_counter() - start
+
+    frames = sum( play["frames"] for play in plays )
+    play_wall = sum( play["wall"] for play in plays )
+    return {
+        "path": job.path,
+        "scene": job.scene_name,
+        "renderer": job.renderer,
+        "wall": wall,
+        "construct": wall - play_wall,
+        "update": sum( play["update"] for play in plays ),
+        "render": timer.get("render"),
+        "encode": timer.get("encode"),
+        "frames": frames,
+        "fps": frames / wall if wall > 0 else 0,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "tex_runs": tex_runs[0],
+        "plays": plays,
+    }
+
+def run(args) -> int:
+    jobs = find_jobs(args.files, args.scenes, args.opengl, args.renderer)
+    report = {
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "quality": args.quality,
+        "cold": args.cold,
+        "python": sys.version.split()[0],
+        "scenes": {},
+    }
+    print(f"{'scene':<40} {'wall (s)':>9} {'construct':>10} {'update':>8} {'render':>8} {'encode':>8} {'fps':>7} {'rss (MB)':>9} {'tex':>5}")
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"), max_tasks_per_child=1) as executor:
+        for job in jobs:
+            result = executor.submit(benchmark_job, job, args.quality, args.cold).result()
+            name = f"{os.path.basename(job.path)}:{job.scene_name}"
+            report["scenes"][name] = result
+            print(
+                f"{name:<40} {result['wall']:>9.2f} {result['construct']:>10.2f} {result['update']:>8.2f} {result['render']:>8.2f}"
+                f" {result['encode']:>8.2f} {result['fps']:>7.1f} {result['peak_rss_mb']:>9.0f} {result['tex_runs']:>5}"
+            )
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"Wrote {args.output}")
+    return 0
+
+def regression(metric: str, old: float, new: float, threshold: float) -> bool:
+    floor = MIN_RSS_MB if metric == "peak_rss_mb" else 0 if metric == "tex_runs" else MIN_SECONDS
+    return new - old > floor and new > old * (1 + threshold)
+
+def compare(args) -> int:
+    with open(args.old) as file:
+        old_report = json.load(file)
+    with open(args.new) as file:
+        new_report = json.load(file)
+    if old_report.get("quality") != new_report.get("quality"):
+        print(f"Warning: comparing quality {old_report.get('quality')} against {new_report.get('quality')}")
+
+    metrics = [ "wall", *PHASES, "peak_rss_mb", "tex_runs" ]
+    regressions = 0
+    print(f"{'scene':<40} {'metric':<14} {'old':>9} {'new':>9} {'change':>8}")
+    for name, new in new_report["scenes"].items():
+        old = old_report["scenes"].get(name)
+        if old is None:
+            print(f"{name:<40} (new scene)")
+            continue
+        rows = [ ( metric, old[metric], new[metric] ) for metric in metrics ]
+        if len(old["plays"]) == len(new["plays"]):
+            rows += [
+                ( f"play {new_play['index']} wall", old_play["wall"], new_play["wall"] )
+                for old_play, new_play in zip(old["plays"], new["plays"])
+            ]
+        for metric, old_value, new_value in rows:
+            is_regression = regression(metric.split()[-1], old_value, new_value, args.threshold)
+            if not ( is_regression or args.verbose ):
+                continue
+            regressions += is_regression
+            change = f"{(new_value / old_value - 1) * 100:+.0f}%" if old_value else "-"
+            flag = "  REGRESSION" if is_regression else ""
+            print(f"{name:<40} {metric:<14} {old_value:>9.2f} {new_value:>9.2f} {change:>8}{flag}")
+    print(f"{regressions} regressions above {args.threshold * 100:.0f}%")
+    return 1 if regressions else 0
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Benchmark scenes and write a JSON report.")
+    run_parser.add_argument("files", nargs="+")
+    run_parser.add_argument("-o", "--output", default="benchmark.json")
+    run_parser.add_argument("-q", "--quality", choices=QUALITIES.keys(), default="l")
+    run_parser.add_argument("--scenes", nargs="*", help="Only these scenes, including unused ones.")
+    run_parser.add_argument("--renderer", choices=[ "cairo", "opengl" ], default="cairo")
+    run_parser.add_argument("--opengl", nargs="*", default=[], help="Scenes to render with OpenGL.")
+    run_parser.add_argument("--cold", action="store_true", help="Start every scene with empty tex caches.")
+
+    compare_parser = commands.add_parser("compare", help="Diff two reports and flag regressions.")
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=0.1, help="Relative slowdown that counts as a regression.")
+    compare_parser.add_argument("-v", "--verbose", action="store_true", help="List every metric, not just regressions.")
+
+    args = parser.parse_args()
+    sys.exit(run(args) if args.command == "run" else compare(args))
+
+if __name__ == "__main__":
+    main()
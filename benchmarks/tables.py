@@ -0,0 +1,57 @@
+"""
+Compares building the four tables of QuatDefinition with MathTable, one MathTex per cell, and
+with CachedMathTable from lib/CachedMathTable, which compiles each distinct cell once. The on-disk
+tex cache is bypassed for both, so every compile runs LaTeX, and manim's own svg cache is
+pointed at an empty directory.
+
+Run from the repository root with:
+```
+python -m benchmarks.tables [--repeat 3]
+```
+"""
+import argparse
+import tempfile
+import time
+
+from manim import *
+
+import lib.CachedMathTable as cached_math_table
+import quaternions
+from lib import texcache
+
+TABLES = [ quaternions.vec_cross_table, quaternions.vec_dot_table, quaternions.pure_quat_times_table, quaternions.quat_times_table ]
+
+def stock_table(table: list) -> MathTable:
+    return MathTable(
+        table,
+        include_outer_lines=True,
+        element_to_mobject=lambda s: MathTex(s, tex_to_color_map=quaternions.color_map),
+    )
+
+def build_all(cached: bool) -> float:
+    # Every table function builds through CachedMathTable, so the stock run swaps it out.
+    original = quaternions.CachedMathTable
+    if not cached:
+        quaternions.CachedMathTable = lambda table, **kwargs: stock_table(table)
+    cached_math_table._entries.clear()
+    try:
+        with tempfile.TemporaryDirectory() as tex_dir, tempconfig({ "tex_dir": tex_dir }), texcache.disabled():
+            start = time.perf_counter()
+            for build in TABLES:
+                build(quaternions.color_map)
+            return time.perf_counter() - start
+    finally:
+        quaternions.CachedMathTable = original
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    stock = min( build_all(False) for _ in range(args.repeat) )
+    cached = min( build_all(True) for _ in range(args.repeat) )
+    print(f"{'MathTable (s)':>14} {'CachedMathTable (s)':>20} {'distinct cells':>15} {'speedup':>9}")
+    print(f"{stock:>14.2f} {cached:>20.2f} {len(cached_math_table._entries):>15} {stock / cached:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -7,13 +7,27 @@ from manim.utils.space_ops import (
     quaternion_conjugate as qconj
 )
 import numpy as np
+from lib.CheckpointScene import CheckpointMixin
 from lib.ComplexArrow import ComplexArrow, ComplexProduct
+from lib.CullingCamera import CullingLayerCachingMovingCamera
+from lib.DedupCairoRenderer import DedupCairoRenderer
 
 from lib.ExternalLabeledDot import ExternalLabeledDot
+from lib.FrameParallelScene import FrameParallelMixin
+from lib.geometry import arc_midpoints, offsets
+from lib.GlyphDecimalNumber import GlyphDecimalNumber
+from lib.InstancedRedraw import always_redraw_instanced
 from lib.LabeledArrow import LabeledArrow
+from lib.LayerCachingCamera import LayerCachingCamera
+from lib.MatrixRotate import MatrixRotate
+from lib.QuaternionRotate import QuaternionRotate
 from lib.TransformMatchingKeyTex import TransformMatchingKeyTex, set_transform_key
 from lib.mathutils import clamp, rotate_cc, rotate_cw, smoothstep
-from lib.utils import angle_label_pos, animate_arc_to, animate_replace_tex, colored_math_tex, compose_colored_tex
+from lib.utils import angle_label_pos, animate_arc_to, animate_replace_tex, colored_math_tex, compose_colored_tex, install_tex_cache_logging
+from lib import updaterprofile
+
+updaterprofile.install_from_env()
+install_tex_cache_logging()
 
 c1 = np.array([1, 0, 0])
 ci = np.array([0, 1, 0])
@@ -21,14 +35,14 @@ ci = np.array([0, 1, 0])
 blank_axis = { "include_ticks": False }
 
 def get_shift( mobj, other ):
-    return other.get_center() - mobj.get_center()
+    return offsets( mobj.get_center(), other.get_center() )
 def eq_shift( eq: MathTex, other: MathTex ):
-    return get_shift( eq.get_part_by_tex("="), other.get_part_by_tex("=") ) * RIGHT
+    return offsets( eq.get_part_by_tex("=").get_center(), other.get_part_by_tex("=").get_center(), RIGHT )
 def align_eqs(eq: MathTex, *others: MathTex):
     for other in others:
         other.shift( eq_shift(other, eq) )
 
-class Intro(ThreeDScene):
+class Intro(FrameParallelMixin, ThreeDScene):
     def construct(self):
         title = Tex("Imaginary Numbers").to_corner(UL)
         self.play(Write(title))
@@ -84,23 +98,23 @@ class Intro(ThreeDScene):
 
         # Add evaluation indicators to graph
         x_tracker = ValueTracker(2.5)
-        def get_dots(plot_axes, func, unit=None, label_dirs=(DOWN, RIGHT+UP*.5)):
+        def get_dots(make, plot_axes, func, unit=None, label_dirs=(DOWN, RIGHT+UP*.5)):
             x = x_tracker.get_value()
             fx = func(x)
             def get_dot(coor_mask: np.ndarray=np.array([1, 1, 1])):
                 coord = np.array([x, fx, 1]) * coor_mask
-                return Dot( plot_axes.c2p(*coord) )
+                return make( Dot, plot_axes.c2p(*coord) )
             dot_xy = get_dot()
             dot_x = get_dot( np.array([1, 0, 1]) )
             dot_y = get_dot( np.array([0, 1, 1]) )
-            line_x = Line( dot_x.get_center(), dot_xy.get_center() )
-            line_y = Line( dot_xy.get_center(), dot_y.get_center() )
+            line_x = make( Line, dot_x.get_center(), dot_xy.get_center() )
+            line_y = make( Line, dot_xy.get_center(), dot_y.get_center() )
             opacity = 1 - (1 / (9*x**2 + 1) )
             x_dir, y_dir = label_dirs
-            decimal_x = DecimalNumber(x,  font_size=36, unit=unit).next_to(dot_x, x_dir).set_opacity(opacity)
-            decimal_y = DecimalNumber(fx, font_size=36).next_to(dot_y, y_dir).set_opacity(opacity)
+            decimal_x = make(GlyphDecimalNumber, x,  font_size=36, unit=unit).next_to(dot_x, x_dir).set_opacity(opacity)
+            decimal_y = make(GlyphDecimalNumber, fx, font_size=36).next_to(dot_y, y_dir).set_opacity(opacity)
             return VGroup( dot_x, line_x, dot_xy, line_y, dot_y, decimal_x, decimal_y )
-        dots = always_redraw( lambda: get_dots( axes, lambda x: x * x ) )
+        dots = always_redraw_instanced( lambda make: get_dots( make, axes, lambda x: x * x ) )
         self.play(Create(dots))
 
         # Sweep x
@@ -122,12 +136,8 @@ class Intro(ThreeDScene):
         graph_parts = VGroup( axes, axes_im, square_graph, dots )
         self.play(graph_parts.animate.shift(UP))
 
-        quat = qmul(
-            aa2q( 15*DEGREES, RIGHT ),
-            aa2q( -75*DEGREES, UP ) )
-        angle, axis = q2aa(quat)
         about_point = axes.c2p(0, 3)
-        self.play( Rotate( graph_parts, angle, axis, about_point=about_point ) )
+        self.play( QuaternionRotate( graph_parts, aa2q( 15*DEGREES, RIGHT ), aa2q( -75*DEGREES, UP ), about_point=about_point ) )
 
         axes_im.set_opacity(1)
         self.play( Create(axes_im) )
@@ -141,8 +151,8 @@ class Intro(ThreeDScene):
         self.play( axes.get_axis(0).animate.set_opacity(.25) )
 
         self.remove(dots)
-        dots = always_redraw( lambda: get_dots( 
-            axes_im, lambda x: -x * x, "i",
+        dots = always_redraw_instanced( lambda make: get_dots( 
+            make, axes_im, lambda x: -x * x, "i",
             ( UP, LEFT )
         ) )
         self.add(dots)
@@ -157,6 +167,11 @@ class Intro(ThreeDScene):
         self.wait()
 
 class ComplexNumbers(Scene):
+    def __init__(self, renderer=None, skip_animations=False, **kwargs):
+        if renderer is None and config.renderer == RendererType.CAIRO:
+            renderer = DedupCairoRenderer(camera_class=LayerCachingCamera, skip_animations=skip_animations)
+        super().__init__(renderer=renderer, camera_class=LayerCachingCamera, skip_animations=skip_animations, **kwargs)
+
     def construct(self):
         title = Tex("Complex Numbers").to_corner(UL)
         self.play(Write(title))
@@ -303,7 +318,7 @@ class ComplexAdditionAndScaling(Scene):
             opacity = smoothstep(1, 1.5, s)
             return LabeledArrow(
                 Arrow(ORIGIN, s * x, buff=0, color=BLUE_A),
-                VGroup(DecimalNumber(s).scale(0.75), MathTex("u", color=BLUE))
+                VGroup(GlyphDecimalNumber(s).scale(0.75), MathTex("u", color=BLUE))
                     .arrange(buff=1/16).set_opacity(opacity),
                 distance=0.35
             )
@@ -546,7 +561,12 @@ class ActionOfI(Scene):
 
         self.wait()
 
-class ArbitraryTimesArbitrary2(MovingCameraScene):
+class ArbitraryTimesArbitrary2(CheckpointMixin, MovingCameraScene):
+    def __init__(self, renderer=None, skip_animations=False, **kwargs):
+        if renderer is None and config.renderer == RendererType.CAIRO:
+            renderer = DedupCairoRenderer(camera_class=CullingLayerCachingMovingCamera, skip_animations=skip_animations)
+        super().__init__(renderer=renderer, camera_class=CullingLayerCachingMovingCamera, skip_animations=skip_animations, **kwargs)
+
     def construct(self):
         color_map = { 
             "a": RED, "b": GREEN,
@@ -601,13 +621,15 @@ class ArbitraryTimesArbitrary2(MovingCameraScene):
 
         # Demonstrate rotation of plane by u
         for _delta_angle in [ PI / 4, -PI / 4 -u_angle, u_angle ]:
-            self.play( Rotate( rotation_group, _delta_angle, about_point=ORIGIN ), run_time=1.5 )
+            self.play( MatrixRotate( rotation_group, _delta_angle, about_point=ORIGIN ), run_time=1.5 )
         self.wait()
         # Demonstrate scaling of plane by u
         self.play( rotation_group.animate.scale(0.5, about_point=ORIGIN), run_time=1.5 )
         self.play( rotation_group.animate.scale(2, about_point=ORIGIN), run_time=1.5 )
         self.wait()
 
+        self.checkpoint("product")
+
         arrow_au = LabeledArrow(
             Arrow( ORIGIN, u * v[0], buff=0, color=RED ),
             MathTex("au", tex_to_color_map=color_map),
@@ -645,10 +667,12 @@ class ArbitraryTimesArbitrary2(MovingCameraScene):
         ) )
         self.wait()
 
+        self.checkpoint("rotate_product")
+
         rotation_group.add( dot_uv.dot, arrow_uv, angle_uv, arrow_au.arrow, arrow_biu.arrow )
 
         self.play( 
-            Rotate( rotation_group, -u_angle, about_point=ORIGIN ),
+            MatrixRotate( rotation_group, -u_angle, about_point=ORIGIN ),
             run_time=1.5
         )
         self.play(
@@ -669,9 +693,11 @@ class ArbitraryTimesArbitrary2(MovingCameraScene):
             animate_replace_tex( arrow_biu.label, "biu", color_map ),
         )
         self.wait()
-        self.play( Rotate( rotation_group, u_angle, about_point=ORIGIN ), run_time=1.5)
+        self.play( MatrixRotate( rotation_group, u_angle, about_point=ORIGIN ), run_time=1.5)
         self.wait(.5)
 
+        self.checkpoint("scale_product")
+
         angle_u.clear_updaters()
         rotation_group.add(angle_u)
         self.play( rotation_group.animate.scale(0.5, about_point=ORIGIN), run_time=1.5 )
@@ -690,6 +716,11 @@ class ArbitraryTimesArbitrary2(MovingCameraScene):
         self.play( Write(eq_polar_product) )
 
 class UnitComplexNumbers(Scene):
+    def __init__(self, renderer=None, skip_animations=False, **kwargs):
+        if renderer is None and config.renderer == RendererType.CAIRO:
+            renderer = DedupCairoRenderer(camera_class=LayerCachingCamera, skip_animations=skip_animations)
+        super().__init__(renderer=renderer, camera_class=LayerCachingCamera, skip_animations=skip_animations, **kwargs)
+
     def construct(self):
         numplane = ComplexPlane()
         numplane.add_coordinates()
@@ -716,16 +747,16 @@ class UnitComplexNumbers(Scene):
 
         theta_tracker = ValueTracker(45*DEGREES)
         def get_dot(label_text, sign=1):
-            def func():
+            def func(make):
                 theta = theta_tracker.get_value() * sign
                 u = np.cos(theta) * RIGHT + np.sin(theta) * UP
-                dot = Dot(u)
-                line = Line(ORIGIN, u)
-                line_re = Line(ORIGIN, RIGHT)
-                angle = Angle(line_re, line, radius=0.25, other_angle=theta<0)
+                dot = make(Dot, u)
+                line = make(Line, ORIGIN, u)
+                line_re = make(Line, ORIGIN, RIGHT)
+                angle = make(Angle, line_re, line, radius=0.25, other_angle=theta<0)
                 theta_text = "\\theta" if sign > 0 else "-\\theta"
-                label_theta = MathTex(theta_text).scale(.8).move_to(angle.get_midpoint() * 2)
-                label = MathTex(label_text).next_to(dot, u, buff=0.1)
+                label_theta = make(MathTex, theta_text).scale(.8).move_to(arc_midpoints(ORIGIN, 0.5, 0, theta))
+                label = make(MathTex, label_text).next_to(dot, u, buff=0.1)
                 result = VDict({
                     "dot": dot, "line": line, "angle": angle,
                     "label_theta": label_theta, "label": label
@@ -733,7 +764,7 @@ class UnitComplexNumbers(Scene):
                 return result
             return func
         
-        dot_u = always_redraw(get_dot("u"))
+        dot_u = always_redraw_instanced(get_dot("u"))
 
         self.play(Create(dot_u))
         self.play(theta_tracker.animate.set_value(135*DEGREES))
@@ -742,7 +773,7 @@ class UnitComplexNumbers(Scene):
         tex_form.next_to(tex_mod_equals_one, DOWN, aligned_edge=LEFT)
         self.play(Write(tex_form))
 
-        dot_uconj = always_redraw(get_dot("\\overline{u}", -1))
+        dot_uconj = always_redraw_instanced(get_dot("\\overline{u}", -1))
         self.play(Create(dot_uconj))
         self.wait()
 
@@ -0,0 +1,80 @@
+import numpy as np
+from manim import *
+
+from lib.texcache import bypassed, cache_key, cached_math_tex
+
+_entries = {}
+
+def cached_entry(tex_string, **kwargs) -> MathTex:
+    """A copy of MathTex(tex_string, **kwargs), which is compiled once per process, or loaded from the tex cache."""
+    # MathTex reads numbers as their strings, so 0 and "0" share an entry.
+    tex_string = str(tex_string)
+    if bypassed():
+        # E.g. placeholder glyphs of a prewarm dry-run, which must not outlive it.
+        return cached_math_tex(tex_string, **kwargs)
+    key = cache_key("CachedMathTable", tex_string, kwargs)
+    if key not in _entries:
+        _entries[key] = cached_math_tex(tex_string, **kwargs)
+    return _entries[key].copy()
+
+class CachedMathTable(MathTable):
+    """
+    MathTable whose entries are copies of one compiled MathTex per distinct string and config,
+    shared by every table in the process, e.g. all the "-1" and "i" cells of the quaternion tables.
+
+    The grid lines are placed from the entries' bounds, found in one pass over their points instead
+    of once per row and column. There is still one Line per grid line, in MathTable's order and
+    direction, so Create and Write draw the grid as they would a MathTable's.
+    """
+    def _table_to_mob_table(self, table) -> list:
+        return [ [ cached_entry(item, **self.element_to_mobject_config) for item in row ] for row in table ]
+
+    def _cell_bounds(self) -> tuple[np.ndarray, np.ndarray]:
+        """(rows, cols, 2, 3) min and max corners of every cell's entry, NaN for entries without points."""
+        cells = [ mob for row in self.mob_table for mob in row ]
+        points = [ mob.get_all_points() for mob in cells ]
+        sizes = np.array([ len(p) for p in points ])
+        bounds = np.full(( len(cells), 2, 3 ), np.nan)
+        drawn = sizes > 0
+        if drawn.any():
+            all_points = np.concatenate(points)
+            starts = np.concatenate([ [ 0 ], np.cumsum(sizes[drawn])[:-1] ])
+            bounds[drawn, 0] = np.minimum.reduceat(all_points, starts)
+            bounds[drawn, 1] = np.maximum.reduceat(all_points, starts)
+        return bounds.reshape(len(self.mob_table), len(self.mob_table[0]), 2, 3)
+
+    def _grid_lines(self, starts: list, ends: list) -> VGroup:
+        lines = VGroup(*[ Line(start, end, **self.line_config) for start, end in zip(starts, ends) ])
+        self.add(*lines)
+        return lines
+
+    def _add_horizontal_lines(self) -> Table:
+        bounds = self._cell_bounds()
+        left = np.nanmin(bounds[..., 0, 0]) - 0.5 * self.h_buff
+        right = np.nanmax(bounds[..., 1, 0]) + 0.5 * self.h_buff
+        tops = np.nanmax(bounds[..., 1, 1], axis=1)
+        bottoms = np.nanmin(bounds[..., 0, 1], axis=1)
+        anchors = []
+        if self.include_outer_lines:
+            anchors += [ tops[0] + 0.5 * self.v_buff, bottoms[-1] - 0.5 * self.v_buff ]
+        anchors += list(tops[1:] + 0.5 * ( bottoms[:-1] - tops[1:] ))
+        self.horizontal_lines = self._grid_lines([ [ left, y, 0 ] for y in anchors ], [ [ right, y, 0 ] for y in anchors ])
+        return self
+
+    def _add_vertical_lines(self) -> Table:
+        bounds = self._cell_bounds()
+        top = np.nanmax(bounds[..., 1, 1]) + 0.5 * self.v_buff
+        bottom = np.nanmin(bounds[..., 0, 1]) - 0.5 * self.v_buff
+        lefts = np.nanmin(bounds[..., 0, 0], axis=0)
+        rights = np.nanmax(bounds[..., 1, 0], axis=0)
+        starts, ends = [], []
+        if self.include_outer_lines:
+            for x in [ lefts[0] - 0.5 * self.h_buff, rights[-1] + 0.5 * self.h_buff ]:
+                starts.append([ x, top, 0 ])
+                ends.append([ x, bottom, 0 ])
+        # MathTable draws the inner lines upwards.
+        for x in lefts[1:] + 0.5 * ( rights[:-1] - lefts[1:] ):
+            starts.append([ x, bottom, 0 ])
+            ends.append([ x, top, 0 ])
+        self.vertical_lines = self._grid_lines(starts, ends)
+        return self
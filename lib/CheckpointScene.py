@@ -0,0 +1,303 @@
+"""
+Named checkpoints that let a render resume construct partway through.
+
+`self.checkpoint("name")`, as a statement directly in a scene's construct (not inside a loop,
+`if` or `with`), starts a section named "name" there and saves the scene's state to disk with
+dill: its mobjects, the camera's mobjects, attributes construct added to the scene, the random
+state and construct's local variables. Closures made in construct, like updater lambdas, keep
+sharing construct's variables after a restore.
+
+When a later render resumes from a checkpoint, the saved state is loaded and the statements of
+construct from the checkpoint on are compiled into a function of their own and run, so nothing
+before the checkpoint executes at all. The output then only holds what comes after it.
+
+A checkpoint is only used while the manim version, the scene class (leaving out construct's
+statements after the checkpoint) and the project modules defining the saved mobjects' classes
+and updaters are unchanged. The rest of the scene's module isn't compared. A checkpoint that is
+missing or out of date is reported and the scene renders from the start.
+
+Configure with the environment variables:
+```
+MANIM_RESUME_FROM    checkpoint name to resume from, or "latest" for the last usable one (default: off)
+MANIM_CHECKPOINTS    checkpoint directory, or "off" to not save any (default: <media_dir>/checkpoints)
+```
+"""
+import ast
+import hashlib
+import inspect
+import os
+import pickle
+import random
+import sys
+import tempfile
+import textwrap
+import types
+
+import manim
+import numpy as np
+from manim import *
+from manim.mobject.opengl.opengl_mobject import OpenGLMobject
+
+try:
+    import dill
+except ImportError:
+    dill = None
+
+# Live objects of the current render, referenced from checkpoints by name instead of saved.
+_live_attributes = [ "renderer", "camera" ]
+
+def checkpoint_dir() -> str | None:
+    path = os.environ.get("MANIM_CHECKPOINTS", os.path.join(config.media_dir, "checkpoints"))
+    if path.lower() == "off":
+        return None
+    return path
+
+def resume_target() -> str | None:
+    return os.environ.get("MANIM_RESUME_FROM") or None
+
+def _construct_tree(construct) -> ast.FunctionDef:
+    lines, first_line = inspect.getsourcelines(construct)
+    function = ast.parse(textwrap.dedent("".join(lines))).body[0]
+    ast.increment_lineno(function, first_line - 1)
+    return function
+
+def _checkpoint_statements(function: ast.FunctionDef) -> dict[str, int]:
+    """Checkpoint name -> index in construct's body, for `self.checkpoint("name")` statements directly in it."""
+    result = {}
+    for index, statement in enumerate(function.body):
+        call = statement.value if isinstance(statement, ast.Expr) else None
+        if (
+            isinstance(call, ast.Call)
+            and isinstance(call.func, ast.Attribute) and call.func.attr == "checkpoint"
+            and call.args and isinstance(call.args[0], ast.Constant)
+        ):
+            result[call.args[0].value] = index
+    return result
+
+def _resume_function(construct, function: ast.FunctionDef, index: int, construct_locals: dict, cells: dict):
+    """
+    Construct's statements from `index` on, as a function whose variables are construct's: the
+    saved closure cells where closures shared them, new cells holding the saved values otherwise.
+    """
+    names = ", ".join(construct_locals)
+    wrapper = ast.parse(
+        f"def wrapper():\n"
+        f"    {' = '.join(construct_locals)} = None\n"
+        f"    def {function.name}():\n"
+        f"        nonlocal {names}\n"
+    )
+    wrapper.body[0].body[1].body.extend(function.body[index:])
+    module_code = compile(wrapper, inspect.getsourcefile(construct), "exec")
+    wrapper_code = next( const for const in module_code.co_consts if isinstance(const, types.CodeType) )
+    code = next( const for const in wrapper_code.co_consts if isinstance(const, types.CodeType) )
+    closure = tuple( cells.get(name) or types.CellType(construct_locals[name]) for name in code.co_freevars )
+    return types.FunctionType(code, construct.__globals__, function.name, None, closure)
+
+def _file_hash(path: str) -> str | None:
+    try:
+        with open(path, "rb") as file:
+            return hashlib.sha256(file.read()).hexdigest()
+    except OSError:
+        return None
+
+def _class_hash(scene_class: type, function: ast.FunctionDef, index: int) -> str:
+    """Hash of the class defining construct, without construct's statements from `index` on."""
+    owner = next( cls for cls in scene_class.__mro__ if "construct" in vars(cls) )
+    lines, first_line = inspect.getsourcelines(owner)
+    start = function.body[index].lineno - first_line
+    end = function.end_lineno - first_line + 1
+    return hashlib.sha256("".join(lines[:start] + lines[end:]).encode()).hexdigest()
+
+def _values(state: dict):
+    for group in ( state["locals"], state["camera"], state["scene"] ):
+        for value in group.values():
+            if isinstance(value, dict):
+                yield from value.keys()
+                yield from value.values()
+            elif isinstance(value, (list, tuple, set)):
+                yield from value
+            else:
+                yield value
+    yield from state["mobjects"]
+    yield from state["foreground_mobjects"]
+
+def _saved_mobjects(state: dict) -> list:
+    mobjects = {}
+    for value in _values(state):
+        if isinstance(value, (Mobject, OpenGLMobject)):
+            mobjects.update( ( id(mobject), mobject ) for mobject in value.get_family() )
+    return list(mobjects.values())
+
+def _functions(state: dict) -> list:
+    """Functions in the state, including the ones they close over, like always_redraw's."""
+    pending = [ value for value in _values(state) if isinstance(value, types.FunctionType) ]
+    for mobject in _saved_mobjects(state):
+        pending.extend(mobject.get_updaters())
+    found = {}
+    while pending:
+        function = pending.pop()
+        if not isinstance(function, types.FunctionType) or id(function) in found:
+            continue
+        found[id(function)] = function
+        for cell in function.__closure__ or ():
+            try:
+                pending.append(cell.cell_contents)
+            except ValueError:
+                pass
+    return list(found.values())
+
+def _project_files(state: dict, scene_class: type) -> list[str]:
+    """Files of the modules next to the scene's that define the saved mobjects' classes and updaters."""
+    module_file = os.path.abspath(inspect.getsourcefile(scene_class))
+    root = os.path.dirname(module_file)
+    names = set()
+    for mobject in _saved_mobjects(state):
+        names.update( cls.__module__ for cls in type(mobject).__mro__ )
+        names.update( getattr(updater, "__module__", None) for updater in mobject.get_updaters() )
+    files = set()
+    for name in names:
+        path = getattr(sys.modules.get(name), "__file__", None)
+        if path and os.path.abspath(path).startswith(root + os.sep) and os.path.abspath(path) != module_file:
+            files.add(os.path.abspath(path))
+    return sorted(files)
+
+def _holds_mobjects(value) -> bool:
+    if isinstance(value, (Mobject, OpenGLMobject)):
+        return True
+    if isinstance(value, dict):
+        value = list(value.keys()) + list(value.values())
+    if isinstance(value, (list, tuple, set)):
+        return any( isinstance(item, (Mobject, OpenGLMobject)) for item in value )
+    return False
+
+class CheckpointMixin:
+    """Scene mixin adding `checkpoint(name)`. See lib/CheckpointScene.py."""
+    def setup(self):
+        super().setup()
+        self._construct_tree = _construct_tree(type(self).construct)
+        self._checkpoints = _checkpoint_statements(self._construct_tree)
+        self._construct_codes = { type(self).construct.__code__ }
+        self._construct_cells = {}
+        self._resume_name = None
+        target = resume_target()
+        if target is not None:
+            self._resume_name = self._find_resume_point(target)
+        if self._resume_name is not None:
+            logger.info(f"Resuming {type(self).__name__} from checkpoint '{self._resume_name}'")
+            self.construct = self._resume
+        self._initial_attributes = set(self.__dict__) | { "_initial_attributes" }
+
+    def _checkpoint_path(self, name: str) -> str:
+        return os.path.join(checkpoint_dir(), type(self).__name__, name + ".pickle")
+
+    def _source_key(self, name: str, files: list[str]) -> dict:
+        return {
+            "manim": manim.__version__,
+            "class": _class_hash(type(self), self._construct_tree, self._checkpoints[name]),
+            "files": { path: _file_hash(path) for path in files },
+        }
+
+    def _find_resume_point(self, target: str) -> str | None:
+        if dill is None or checkpoint_dir() is None:
+            logger.warning(f"Resuming needs dill and MANIM_CHECKPOINTS on, rendering {type(self).__name__} from the start")
+            return None
+        names = list(self._checkpoints) if target == "latest" else [ target ]
+        for name in reversed(names):
+            if name not in self._checkpoints:
+                logger.warning(f"No checkpoint named '{name}' directly in {type(self).__name__}.construct")
+                continue
+            try:
+                with open(self._checkpoint_path(name), "rb") as file:
+                    key = pickle.load(file)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                logger.info(f"Checkpoint '{name}' has not been saved yet")
+                continue
+            if key == self._source_key(name, list(key["files"])):
+                return name
+            logger.info(f"Checkpoint '{name}' is out of date")
+        logger.warning(f"No usable checkpoint for '{target}', rendering {type(self).__name__} from the start")
+        return None
+
+    def _persistent_objects(self) -> dict:
+        objects = { "scene": self }
+        for attribute in _live_attributes:
+            objects[attribute] = getattr(self, attribute)
+        objects["file_writer"] = self.renderer.file_writer
+        return objects
+
+    def _state(self, frame) -> dict:
+        state = {
+            "locals": dict(frame.f_locals),
+            "mobjects": self.mobjects,
+            "foreground_mobjects": self.foreground_mobjects,
+            "camera": { key: value for key, value in self.renderer.camera.__dict__.items() if _holds_mobjects(value) },
+            "scene": { key: value for key, value in self.__dict__.items() if key not in self._initial_attributes },
+            "random": ( random.getstate(), np.random.get_state() ),
+        }
+        # The cells closures made in construct share, saved alongside them so they stay shared.
+        cells = dict(self._construct_cells)
+        for function in _functions(state):
+            if function.__code__ in frame.f_code.co_consts:
+                cells.update(zip(function.__code__.co_freevars, function.__closure__ or ()))
+        state["cells"] = { name: cell for name, cell in cells.items() if name in state["locals"] }
+        return state
+
+    def _save_checkpoint(self, name: str, frame):
+        directory = os.path.dirname(self._checkpoint_path(name))
+        os.makedirs(directory, exist_ok=True)
+        ids = { id(value): key for key, value in self._persistent_objects().items() }
+
+        class Pickler(dill.Pickler):
+            def persistent_id(self, obj):
+                return ids.get(id(obj))
+
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            state = self._state(frame)
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump(self._source_key(name, _project_files(state, type(self))), file)
+                Pickler(file, protocol=pickle.HIGHEST_PROTOCOL, recurse=True).dump(state)
+            os.replace(temp_path, self._checkpoint_path(name))
+        except Exception as error:
+            logger.warning(f"Could not save checkpoint '{name}': {error}")
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _resume(self):
+        """Stands in for construct: restores the checkpoint and runs construct from there."""
+        objects = self._persistent_objects()
+
+        class Unpickler(dill.Unpickler):
+            def persistent_load(self, pid):
+                return objects[pid]
+
+        with open(self._checkpoint_path(self._resume_name), "rb") as file:
+            pickle.load(file)
+            state = Unpickler(file).load()
+        self.mobjects = state["mobjects"]
+        self.foreground_mobjects = state["foreground_mobjects"]
+        self.renderer.camera.__dict__.update(state["camera"])
+        self.__dict__.update(state["scene"])
+        random.setstate(state["random"][0])
+        np.random.set_state(state["random"][1])
+
+        construct = _resume_function(
+            type(self).construct, self._construct_tree, self._checkpoints[self._resume_name],
+            state["locals"], state["cells"],
+        )
+        self._construct_codes.add(construct.__code__)
+        self._construct_cells = dict(zip(construct.__code__.co_freevars, construct.__closure__))
+        construct()
+
+    def checkpoint(self, name: str, **section_kwargs):
+        """Marks a point construct can resume from, and starts a section named `name` there."""
+        frame = sys._getframe(1)
+        if frame.f_code not in self._construct_codes or name not in self._checkpoints:
+            raise ValueError(f"Checkpoint '{name}' must be a statement directly in {type(self).__name__}.construct")
+        if name != self._resume_name and checkpoint_dir() is not None:
+            if dill is None:
+                logger.warning(f"Skipping checkpoint '{name}', saving checkpoints needs dill")
+            else:
+                self._save_checkpoint(name, frame)
+        self.next_section(name, **section_kwargs)
@@ -1,6 +1,9 @@
 import cmath
 from manim import *
 
+from lib.InstancedRedraw import always_redraw_instanced
+from lib.ReshapableArrow import ReshapableArrow
+
 def comp2vec(c: complex):
     return np.array([c.real, c.imag, 0])
 
@@ -45,7 +48,7 @@ class ComplexProduct(VMobject):
         arrow_v_copy = self.arrow_v.copy()
         self.add(arrow_u_copy, arrow_v_copy)
 
-        display_arrow = lambda arrow: always_redraw(lambda: Arrow(
+        display_arrow = lambda arrow: always_redraw_instanced(lambda make: make(ReshapableArrow,
             arrow.arrow.get_start(),
             arrow.arrow.get_end(),
             color=arrow.arrow.get_fill_color(),
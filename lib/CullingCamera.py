@@ -0,0 +1,64 @@
+import weakref
+
+import numpy as np
+from manim import *
+
+from lib.LayerCachingCamera import LayerCachingMixin
+from lib.statehash import points_stamp
+
+class CullingMixin:
+    """
+    Cairo camera mixin that leaves out submobjects lying entirely outside the camera frame.
+
+    Cairo clips what falls outside the frame, but still pays for building and stroking every
+    path, so a large NumberPlane costs as much as its whole grid however little of it is shown.
+    Here the bounding boxes of each family's submobjects are computed in one pass over the family's
+    points and cached until the points change. Each frame, only submobjects whose boxes, padded
+    by their stroke width, overlap the frame are drawn. The frame is read on every capture, so
+    camera moves and zooms are followed.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._family_boxes = weakref.WeakKeyDictionary()
+
+    def _boxes(self, mobject: Mobject) -> tuple[list, np.ndarray]:
+        """Submobjects with points and their (min, max) corners, padded by stroke width."""
+        stamp = points_stamp(mobject)
+        cached = self._family_boxes.get(mobject)
+        if cached is not None and cached[0] == stamp:
+            return cached[1], cached[2]
+        family = mobject.family_members_with_points()
+        boxes = np.zeros(( len(family), 2, 3 ))
+        if family:
+            sizes = [ len(mob.points) for mob in family ]
+            starts = np.concatenate([ [ 0 ], np.cumsum(sizes)[:-1] ])
+            points = np.concatenate([ mob.points for mob in family ])
+            # Pad by half the widest stroke, in the units cairo strokes with.
+            pad = np.array([
+                0.5 * self.cairo_line_width_multiple * max(
+                    np.max(getattr(mob, "stroke_width", 0)),
+                    np.max(getattr(mob, "background_stroke_width", 0)),
+                )
+                for mob in family
+            ])[:, None]
+            boxes[:, 0] = np.minimum.reduceat(points, starts, axis=0) - pad
+            boxes[:, 1] = np.maximum.reduceat(points, starts, axis=0) + pad
+        self._family_boxes[mobject] = ( stamp, family, boxes )
+        return family, boxes
+
+    def get_mobjects_to_display(self, mobjects, *args, **kwargs):
+        to_display = super().get_mobjects_to_display(mobjects, *args, **kwargs)
+        center = np.asarray(self.frame_center)[:2]
+        half_size = np.array([ self.frame_width, self.frame_height ]) / 2
+        visible = set()
+        for mobject in mobjects:
+            family, boxes = self._boxes(mobject)
+            inside = np.all(( boxes[:, 0, :2] <= center + half_size ) & ( boxes[:, 1, :2] >= center - half_size ), axis=1)
+            visible.update( id(mob) for mob, keep in zip(family, inside) if keep )
+        return [ mob for mob in to_display if id(mob) in visible ]
+
+class CullingMovingCamera(CullingMixin, MovingCamera):
+    pass
+
+class CullingLayerCachingMovingCamera(CullingMixin, LayerCachingMixin, MovingCamera):
+    pass
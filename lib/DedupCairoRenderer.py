@@ -0,0 +1,78 @@
+from collections import OrderedDict
+
+import numpy as np
+from manim import *
+
+from lib.LayerCachingCamera import LayerCachingMixin
+from lib.statehash import camera_fingerprint, mobject_fingerprint
+
+class DedupCairoRenderer(CairoRenderer):
+    """
+    CairoRenderer that recognizes frames it has already drawn from the state of the mobjects in
+    them, instead of rasterizing them again.
+
+    Each frame is keyed by the camera, the static background it starts from and fingerprints of
+    every mobject drawn. A frame with the same key as the last one is left in the camera as is,
+    and one of the max_cached_frames most recent frames is copied back into it. Keeping more than
+    the last frame only pays off for scenes flipping between frames, and costs every new frame an
+    extra allocation. Stock manim already freezes waits when no updater takes dt; this also
+    catches the frames of a wait with such an updater, or of any animation, that leave the scene
+    as it was. With a LayerCachingMixin camera, the draw list and fingerprints are computed once
+    here and handed to the camera.
+    """
+    max_cached_frames = 1
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._frame_key = None
+        self._static_key = None
+        # key -> read-only pixels
+        self._frames = OrderedDict()
+
+    def _fingerprint_mobjects(self, mobjects, **kwargs) -> tuple[list, list]:
+        if isinstance(self.camera, LayerCachingMixin):
+            return self.camera.fingerprint_mobjects(mobjects, **kwargs)
+        mobjects = self.camera.get_mobjects_to_display(mobjects, **kwargs)
+        return mobjects, [ mobject_fingerprint(mobject) for mobject in mobjects ]
+
+    def update_frame(self, scene, mobjects=None, include_submobjects=True, ignore_skipping=True, **kwargs):
+        if self.skip_animations and not ignore_skipping:
+            return
+        if not mobjects:
+            mobjects = list_update(scene.mobjects, scene.foreground_mobjects)
+        to_display, fingerprints = self._fingerprint_mobjects(mobjects, include_submobjects=include_submobjects, **kwargs)
+        key = (
+            self._static_key if self.static_image is not None else None,
+            camera_fingerprint(self.camera),
+            tuple(fingerprints),
+        )
+        if key == self._frame_key:
+            return
+        self._frame_key = key
+        if key in self._frames:
+            self._frames.move_to_end(key)
+            self.camera.pixel_array[...] = self._frames[key]
+            return
+        if not isinstance(self.camera, LayerCachingMixin):
+            return super().update_frame(scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+        if self.static_image is not None:
+            self.camera.set_frame_to_background(self.static_image)
+        else:
+            self.camera.reset()
+        self.camera.capture_fingerprinted(to_display, fingerprints)
+
+    def get_frame(self):
+        frame = self._frames.get(self._frame_key)
+        if frame is None:
+            frame = np.array(self.camera.pixel_array)
+            # Handed out again for every repeat of this frame.
+            frame.flags.writeable = False
+            self._frames[self._frame_key] = frame
+            while len(self._frames) > self.max_cached_frames:
+                self._frames.popitem(last=False)
+        return frame
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        static_image = super().save_static_frame_data(scene, static_mobjects)
+        self._static_key = self._frame_key if static_image is not None else None
+        return static_image
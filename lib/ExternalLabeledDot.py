@@ -1,5 +1,7 @@
 from manim import *
 
+from lib.statehash import points_stamp
+
 UP_RIGHT = normalize(UP + RIGHT)
 
 class ExternalLabeledDot(VMobject):
@@ -8,6 +10,7 @@ class ExternalLabeledDot(VMobject):
         super().__init__(**kwargs)
         
         self.dot = dot
+        self._label_stamp = None
         if isinstance(label_or_str, str):
             self.label = MathTex(label_or_str)
         else:
@@ -26,8 +29,18 @@ class ExternalLabeledDot(VMobject):
         self.position_label(self.label)
         self.label.add_updater(lambda label: self.position_label(label))
 
+    def _get_dot_stamp(self) -> tuple:
+        return ( points_stamp(self.dot), tuple(self.direction), self.distance, tuple(self.aligned_edge) )
+
     def position_label(self, label):
-        return label.next_to(self.dot, direction=self.direction * self.distance, aligned_edge=self.aligned_edge)
+        # Skip frames where neither the dot nor the label moved since the label was last placed.
+        dot_stamp = self._get_dot_stamp()
+        if self._label_stamp == ( dot_stamp, points_stamp(label) ):
+            return label
+        label.next_to(self.dot, direction=self.direction * self.distance, aligned_edge=self.aligned_edge)
+        # Moving the label gave it new versions, the dot's still hold.
+        self._label_stamp = ( dot_stamp, points_stamp(label) )
+        return label
     
     def create_animation(self):
         return AnimationGroup(
@@ -0,0 +1,152 @@
+import inspect
+import os
+import traceback
+from pathlib import Path
+
+import numpy as np
+from manim import *
+
+from lib.statehash import mobject_fingerprint
+
+def _has_dt_parameter(updater) -> bool:
+    try:
+        return "dt" in inspect.signature(updater).parameters
+    except (TypeError, ValueError):
+        return True
+
+def _wait_for(pid: int) -> bool:
+    return os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1]) == 0
+
+class FrameParallelMixin:
+    """
+    Scene mixin that renders long plays in parallel, a range of frames per forked worker.
+
+    Forking snapshots the scene as it stands at the start of the play. Each worker brings the
+    animations to the first time of its range, rasterizes and encodes its frames into a chunk
+    file, and the chunks are then joined in order into the play's partial movie file. The parent
+    jumps straight to the final time and carries on.
+
+    This only holds when every frame is a function of the start state and the time, so a play
+    is rendered serially when it has scene updaters, updaters taking dt, a stop condition, or
+    when applying the animations and updaters twice at the same time doesn't give the same
+    state twice, e.g. an updater that shifts a mobject by a fixed step. Side effects outside of
+    the scene's mobjects can't be seen, so updaters with those should not be used with it.
+    """
+    frame_parallel_workers: int | None = None
+    min_frames_per_worker = 15
+
+    def _play_mobject_family(self) -> list:
+        mobjects = self.get_mobject_family_members()
+        seen = set(map(id, mobjects))
+        for animation in self.animations:
+            for mob in animation.mobject.get_family():
+                if id(mob) not in seen:
+                    seen.add(id(mob))
+                    mobjects.append(mob)
+        return mobjects
+
+    def _state_fingerprint(self) -> tuple:
+        return tuple( mobject_fingerprint(mob) for mob in self._play_mobject_family() )
+
+    def _is_idempotent_at(self, t: float) -> bool:
+        # Probed in a fork, so whatever the animations and updaters do is thrown away.
+        pid = os.fork()
+        if pid == 0:
+            idempotent = False
+            try:
+                states = []
+                for _ in range(2):
+                    for animation in self.animations:
+                        animation.interpolate(t / animation.run_time)
+                    self.update_mobjects(0)
+                    states.append(self._state_fingerprint())
+                idempotent = states[0] == states[1]
+            finally:
+                os._exit(0 if idempotent else 1)
+        return _wait_for(pid)
+
+    def _serial_reason(self, skip_rendering: bool, frame_count: int) -> str | None:
+        if not hasattr(os, "fork"):
+            return "no fork on this platform"
+        if config.renderer != RendererType.CAIRO:
+            return "not the cairo renderer"
+        if skip_rendering or self.renderer.skip_animations or self.skip_animation_preview:
+            return "frames are skipped"
+        if not write_to_movie() or is_png_format():
+            return "not writing a movie"
+        if self.stop_condition is not None:
+            return "has a stop condition"
+        if self.updaters:
+            return "has scene updaters"
+        if frame_count < 2 * self.min_frames_per_worker:
+            return "too short"
+        if any( _has_dt_parameter(updater) for mob in self._play_mobject_family() for updater in mob.updaters ):
+            return "has updaters that take dt"
+        if not self._is_idempotent_at(self.duration / 2):
+            return "animations or updaters have side effects"
+        return None
+
+    def _render_chunk(self, times: np.ndarray, start: int, stop: int, path: Path):
+        file_writer = self.renderer.file_writer
+        file_writer.open_movie_pipe(file_path=path)
+        if start > 0:
+            self.last_t = times[start - 1]
+        for t in times[start:stop]:
+            self.update_to_time(t)
+            self.renderer.render(self, t, self.moving_mobjects)
+        file_writer.writing_process.stdin.close()
+        file_writer.writing_process.wait()
+
+    def play_internal(self, skip_rendering: bool = False):
+        self.duration = self.get_run_time(self.animations)
+        times = np.arange(0, self.duration, 1 / config.frame_rate)
+        reason = self._serial_reason(skip_rendering, len(times))
+        if reason is not None:
+            logger.debug(f"Animation {self.renderer.num_plays} rendered serially: {reason}")
+            return super().play_internal(skip_rendering)
+
+        workers = min( self.frame_parallel_workers or os.cpu_count() or 1, len(times) // self.min_frames_per_worker )
+        bounds = np.linspace(0, len(times), workers + 1).astype(int)
+        file_writer = self.renderer.file_writer
+        output = Path(file_writer.partial_movie_file_path)
+        chunks = [ output.with_name(f"{output.stem}_chunk{index:03d}{output.suffix}") for index in range(workers) ]
+        logger.info(f"Animation {self.renderer.num_plays}: rendering {len(times)} frames on {workers} workers")
+
+        # The pipe opened for this play is replaced by the joined chunks. Kill it before forking,
+        # so no worker holds it open.
+        file_writer.writing_process.stdin.close()
+        file_writer.writing_process.kill()
+        file_writer.writing_process.wait()
+
+        pids = []
+        for index in range(workers):
+            pid = os.fork()
+            if pid == 0:
+                code = 1
+                try:
+                    self._render_chunk(times, bounds[index], bounds[index + 1], chunks[index])
+                    code = 0
+                except BaseException:
+                    traceback.print_exc()
+                finally:
+                    os._exit(code)
+            pids.append(pid)
+        failed = [ index for index, pid in enumerate(pids) if not _wait_for(pid) ]
+        if failed:
+            raise RuntimeError(f"Frame-parallel workers {failed} failed for animation {self.renderer.num_plays}")
+
+        file_writer.combine_files(chunks, output)
+        for chunk in chunks:
+            chunk.unlink(missing_ok=True)
+
+        # Catch the parent up to the last frame the workers drew.
+        if len(times) > 1:
+            self.last_t = times[-2]
+        self.update_to_time(times[-1])
+        self.renderer.time += len(times) / config.frame_rate
+
+        for animation in self.animations:
+            animation.finish()
+            animation.clean_up_from_scene(self)
+        self.update_mobjects(0)
+        self.renderer.static_image = None
@@ -0,0 +1,158 @@
+import numpy as np
+from manim import *
+from manim.utils.bezier import interpolate as straight_path_function
+from manim.utils.space_ops import rotation_matrix
+
+def _is_circles_path(path_func) -> bool:
+    return getattr(path_func, "__qualname__", "") == "path_along_circles.<locals>.path"
+
+def _is_stock_transform(animation: Animation) -> bool:
+    """A Transform interpolating the way Transform does, with a path func this module can redo."""
+    cls = type(animation)
+    return (
+        isinstance(animation, Transform)
+        and cls.interpolate is Animation.interpolate
+        and cls.interpolate_mobject is Animation.interpolate_mobject
+        and cls.interpolate_submobject is Transform.interpolate_submobject
+        and cls.get_all_families_zipped is Transform.get_all_families_zipped
+        and animation.lag_ratio == 0
+        and (
+            animation.path_func is straight_path_function
+            or _is_circles_path(animation.path_func) and np.shape(animation.path_arc_centers) == ( 3, )
+        )
+    )
+
+class _Group:
+    """Submobjects of animations that move along the same path with the same alpha each frame."""
+    def __init__(self, animations: list, families: list):
+        first = animations[0]
+        self.animation = first
+        self.verified = False
+        self.circles = _is_circles_path(first.path_func)
+        self.families = [ family for families_of_animation in families for family in families_of_animation ]
+        self.path_funcs = [ animation.path_func for animation, families_of_animation in zip(animations, families) for _ in families_of_animation ]
+        sizes = [ len(start.points) for _, start, _ in self.families ]
+        bounds = np.concatenate([ [ 0 ], np.cumsum(sizes) ]).astype(int)
+        self.slices = [ slice(bounds[i], bounds[i + 1]) for i in range(len(sizes)) ]
+        # BLAS takes a different path for single rows, so those are multiplied on their own.
+        self.single_rows = [ item for item, size in zip(self.slices, sizes) if size < 2 ]
+        self.starts = np.concatenate([ start.points for _, start, _ in self.families ])
+        self.ends = np.concatenate([ target.points for _, _, target in self.families ])
+
+        if self.circles:
+            axis = first.path_arc_axis
+            if np.linalg.norm(axis) == 0:
+                axis = OUT
+            self.unit_axis = axis / np.linalg.norm(axis)
+            self.centers = np.concatenate([
+                np.broadcast_to(animation.path_arc_centers, ( sum(len(start.points) for _, start, _ in animation_families), 3 ))
+                for animation, animation_families in zip(animations, families)
+            ])
+            # What path_along_circles computes from the end points on every frame, once.
+            self.ends = self._rotate(self.ends, rotation_matrix(-first.path_arc, self.unit_axis))
+
+    def _rotate(self, points: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+        result = self.centers + np.dot(points - self.centers, matrix.T)
+        for rows in self.single_rows:
+            result[rows] = self.centers[rows] + np.dot(points[rows] - self.centers[rows], matrix.T)
+        return result
+
+    def interpolate(self, alpha: float) -> float:
+        sub_alpha = self.animation.get_sub_alpha(alpha, 0, 1)
+        points = interpolate(self.starts, self.ends, sub_alpha)
+        if self.circles:
+            points = self._rotate(points, rotation_matrix(sub_alpha * self.animation.path_arc, self.unit_axis))
+        for ( submobject, start, target ), rows in zip(self.families, self.slices):
+            submobject.points = points[rows]
+            submobject.interpolate_color(start, target, sub_alpha)
+        return sub_alpha
+
+    def matches_stock(self, sub_alpha: float) -> bool:
+        return all(
+            np.array_equal(submobject.points, path_func(start.points, target.points, sub_alpha))
+            for ( submobject, start, target ), path_func in zip(self.families, self.path_funcs)
+        )
+
+class FusedTransforms:
+    """
+    The Transforms among a play's animations, typically Rotates and `.animate` calls, interpolated
+    together. Points of every submobject moving with the same path and alpha are kept in one
+    buffer, so a frame is one interpolation and, for rotations, one matrix product per group
+    instead of a pass per submobject. The arithmetic is the same as Transform's, so the points
+    come out bit-identical; the first frame in between is checked against Transform to make sure.
+    """
+    def __init__(self, animations: list):
+        self.animations = animations
+        self.fused = []
+        self.fused_ids = set()
+        self.groups = []
+        self.separately = False
+
+        candidates = [ animation for animation in animations if _is_stock_transform(animation) ]
+        others = [ animation for animation in animations if animation not in candidates ]
+        claimed = { id(mob) for animation in others for mob in animation.mobject.get_family() }
+        by_key = {}
+        for animation in candidates:
+            family = animation.mobject.get_family()
+            to_update = [ mob for top in animation.get_all_mobjects_to_update() for mob in top.get_family() ]
+            families = list(animation.get_all_families_zipped())
+            if (
+                any( id(mob) in claimed for mob in family )
+                or any( mob.updaters for mob in to_update )
+                or any( type(mob).interpolate is not Mobject.interpolate for mob, _, _ in families )
+                or any( start.points.shape != target.points.shape or start.points.shape[1:] != ( 3, ) for _, start, target in families )
+                or not families
+            ):
+                continue
+            claimed.update( id(mob) for mob in family )
+            axis = animation.path_arc_axis
+            key = (
+                _is_circles_path(animation.path_func), animation.path_arc, tuple(np.asarray(axis, dtype=float)),
+                animation.run_time, animation.rate_func, animation.reverse_rate_function,
+            )
+            by_key.setdefault(key, []).append(( animation, families ))
+            self.fused.append(animation)
+            self.fused_ids.add(id(animation))
+        self.groups = [ _Group([ a for a, _ in entries ], [ f for _, f in entries ]) for entries in by_key.values() ]
+
+    def interpolate(self, t: float):
+        """Interpolates every fused animation to time t."""
+        if self.separately:
+            for animation in self.fused:
+                animation.interpolate(t / animation.run_time)
+            return
+        for group in self.groups:
+            sub_alpha = group.interpolate(t / group.animation.run_time)
+            if group.verified:
+                continue
+            if not group.matches_stock(sub_alpha):
+                logger.debug("Fused transforms differ from Transform's, interpolating separately")
+                self.separately = True
+                return self.interpolate(t)
+            # Start and end frames say little about the rotation, check the first one in between.
+            group.verified = bool(0 < sub_alpha < 1)
+
+class FusedTransformMixin:
+    """Scene mixin interpolating the Transforms of each play together, see FusedTransforms."""
+    def begin_animations(self):
+        super().begin_animations()
+        self._fused_transforms = None
+        if config.renderer == RendererType.CAIRO:
+            fused = FusedTransforms(self.animations)
+            if fused.groups:
+                self._fused_transforms = fused
+
+    def update_to_time(self, t):
+        fused = getattr(self, "_fused_transforms", None)
+        if fused is None or fused.animations is not self.animations or fused.separately:
+            return super().update_to_time(t)
+        dt = t - self.last_t
+        self.last_t = t
+        for animation in self.animations:
+            animation.update_mobjects(dt)
+            if id(animation) not in fused.fused_ids:
+                animation.interpolate(t / animation.run_time)
+        fused.interpolate(t)
+        self.update_mobjects(dt)
+        self.update_meshes(dt)
+        self.update_self(dt)
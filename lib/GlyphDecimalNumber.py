@@ -0,0 +1,90 @@
+from manim import *
+
+from lib.statehash import touch_points
+from lib.texcache import bypassed
+
+# (mob_class, string, kwargs) -> glyph mobject at the default font size, shared by every instance.
+glyph_atlas: dict[tuple[type, str, tuple], VMobject] = {}
+
+ATLAS_STRINGS = "0123456789-+.,"
+
+def _glyph_key(mob_class: type, string: str, kwargs: dict) -> tuple:
+    # Values like colors aren't hashable, so the kwargs are keyed by their reprs.
+    return (mob_class, string, tuple(sorted( (name, repr(value)) for name, value in kwargs.items() )))
+
+def get_glyph(mob_class: type, string: str, **kwargs) -> VMobject:
+    if bypassed():
+        # E.g. placeholder glyphs of a prewarm dry-run, which must not outlive it.
+        return mob_class(string, **kwargs)
+    key = _glyph_key(mob_class, string, kwargs)
+    if key not in glyph_atlas:
+        glyph_atlas[key] = mob_class(string, **kwargs)
+    return glyph_atlas[key]
+
+class GlyphDecimalNumber(DecimalNumber):
+    """
+    DecimalNumber that lays out glyphs from a shared atlas. Digits, signs, separators and the
+    unit are typeset once per process when the first instance is built. set_value then reuses
+    the glyph mobjects it already holds, copying atlas points into them, so sweeping a value
+    allocates nothing new and never reaches LaTeX.
+    """
+    def __init__(self, number: float = 0, unit: str | None = None, **kwargs):
+        self._recycled_glyphs = {}
+        mob_class = kwargs.get("mob_class", MathTex)
+        for string in ATLAS_STRINGS:
+            get_glyph(mob_class, string)
+        if unit is not None:
+            get_glyph(SingleStringMathTex, unit)
+        super().__init__(number, unit=unit, **kwargs)
+
+    def _string_to_mob(self, string: str, mob_class: VMobject | None = None, **kwargs):
+        if mob_class is None:
+            mob_class = self.mob_class
+        key = _glyph_key(mob_class, string, kwargs)
+        glyph = get_glyph(mob_class, string, **kwargs)
+        recycled = self._recycled_glyphs.get(key)
+        if recycled:
+            mob = recycled.pop()
+            for submob, glyph_submob in zip(mob.get_family(), glyph.get_family()):
+                if submob.points.shape == glyph_submob.points.shape:
+                    submob.points[...] = glyph_submob.points
+                    touch_points(submob)
+                else:
+                    submob.points = glyph_submob.points.copy()
+        else:
+            mob = glyph.copy()
+            mob.glyph_key = key
+        mob.font_size = self._font_size
+        return mob
+
+    def _set_submobjects_from_number(self, number):
+        self._recycled_glyphs = {}
+        for mob in self.submobjects:
+            key = getattr(mob, "glyph_key", None)
+            if key is not None:
+                self._recycled_glyphs.setdefault(key, []).append(mob)
+        super()._set_submobjects_from_number(number)
+        self._recycled_glyphs = {}
+
+    def set_value(self, number: float):
+        # Same as DecimalNumber.set_value, except that the cairo workaround of zeroing the
+        # old family's points must skip glyphs that were reused in the new family.
+        old_family = self.get_family()
+        old_font_size = self.font_size
+        move_to_point = self.get_edge_center(self.edge_to_fix)
+        old_submobjects = self.submobjects
+
+        self._set_submobjects_from_number(number)
+        self.font_size = old_font_size
+        self.move_to(move_to_point, self.edge_to_fix)
+        for sm1, sm2 in zip(self.submobjects, old_submobjects):
+            sm1.match_style(sm2)
+
+        if config.renderer == RendererType.CAIRO:
+            new_family = set(map(id, self.get_family()))
+            for mob in old_family:
+                if id(mob) not in new_family:
+                    mob.points[:] = 0
+
+        self.init_colors()
+        return self
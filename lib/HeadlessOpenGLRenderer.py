@@ -0,0 +1,82 @@
+"""
+OpenGL rendering on machines without a display or GPU, like CI and render nodes.
+
+Run with `--renderer=opengl --write_to_movie` as usual. Scenes with HeadlessOpenGLMixin then
+render offscreen through an EGL context with no window system (Mesa's surfaceless platform),
+rasterized in software by llvmpipe unless LIBGL_ALWAYS_SOFTWARE says otherwise. Each frame is
+read back into one reusable buffer that is handed straight to the encoder pipe.
+
+Headless mode is picked automatically on Linux without DISPLAY or WAYLAND_DISPLAY. Force it
+on or off with the environment variable:
+```
+MANIM_OPENGL_HEADLESS  "auto" (default), "on" or "off"
+```
+The Mesa EGL and llvmpipe drivers are needed, e.g. the libegl1 and libgl1-mesa-dri packages.
+"""
+import os
+import sys
+
+import moderngl
+from manim import *
+from manim.renderer.opengl_renderer import OpenGLRenderer
+
+def is_headless() -> bool:
+    setting = os.environ.get("MANIM_OPENGL_HEADLESS", "auto").lower()
+    if setting in ( "on", "1", "true" ):
+        return True
+    if setting in ( "off", "0", "false" ):
+        return False
+    return sys.platform.startswith("linux") and not ( os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY") )
+
+class HeadlessOpenGLRenderer(OpenGLRenderer):
+    """OpenGLRenderer drawing into an offscreen EGL context, never a window."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pixels = None
+
+    def should_create_window(self):
+        return False
+
+    def init_scene(self, scene):
+        if not hasattr(self, "window"):
+            # Must be set before the EGL library is loaded.
+            os.environ.setdefault("EGL_PLATFORM", "surfaceless")
+            os.environ.setdefault("LIBGL_ALWAYS_SOFTWARE", "1")
+            self.window = None
+            self.context = moderngl.create_context(standalone=True, backend="egl", require=330)
+            self.frame_buffer_object = self.get_frame_buffer_object(self.context, 0)
+            self.frame_buffer_object.use()
+            # What OpenGLRenderer.init_scene sets up for the contexts it makes.
+            self.context.enable(moderngl.BLEND)
+            self.context.wireframe = config["enable_wireframe"]
+            self.context.blend_func = (
+                moderngl.SRC_ALPHA,
+                moderngl.ONE_MINUS_SRC_ALPHA,
+                moderngl.ONE,
+                moderngl.ONE,
+            )
+        super().init_scene(scene)
+
+    def get_raw_frame_buffer_object_data(self, dtype="f1"):
+        if dtype != "f1":
+            return super().get_raw_frame_buffer_object_data(dtype)
+        # Read into the same buffer every frame. The file writer sends it to ffmpeg as is.
+        viewport = self.frame_buffer_object.viewport
+        size = viewport[2] * viewport[3] * 4
+        if self._pixels is None or len(self._pixels) != size:
+            self._pixels = bytearray(size)
+        self.frame_buffer_object.read_into(self._pixels, viewport=viewport, components=4)
+        return memoryview(self._pixels)
+
+    def get_frame(self):
+        # The raw data is overwritten by the next frame, so don't hand out a view of it.
+        return super().get_frame().copy()
+
+class HeadlessOpenGLMixin:
+    """Scene mixin rendering with HeadlessOpenGLRenderer when the OpenGL renderer runs headless."""
+    def __init__(self, renderer=None, **kwargs):
+        # manim's CLI passes its own OpenGLRenderer positionally, which would open a window.
+        stock = renderer is None or type(renderer) is OpenGLRenderer
+        if stock and config.renderer == RendererType.OPENGL and is_headless():
+            renderer = HeadlessOpenGLRenderer()
+        super().__init__(renderer=renderer, **kwargs)
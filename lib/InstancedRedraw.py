@@ -0,0 +1,168 @@
+from typing import Callable
+from manim import *
+import numpy as np
+
+from lib.GlyphDecimalNumber import GlyphDecimalNumber
+from lib.geometry import angle_arc, arc_points
+from lib.ReshapableArrow import ReshapableArrow, reshape_arrow, tip_template
+
+# Attributes copied back from the freshly constructed state before each frame, so chained
+# calls like .scale() or .set_opacity() apply to the same starting point every frame.
+_style_attributes = [
+    "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas",
+    "stroke_width", "background_stroke_width",
+]
+
+def _copy_into(target, source):
+    if isinstance(source, np.ndarray):
+        if isinstance(target, np.ndarray) and target.shape == source.shape:
+            target[...] = source
+            return target
+        return source.copy()
+    return source
+
+def restore(mobject: Mobject, initial: Mobject):
+    """Resets mobject's points and style to initial's, writing into the existing arrays when shapes allow."""
+    family = mobject.get_family()
+    initial_family = initial.get_family()
+    if len(family) != len(initial_family):
+        mobject.become(initial)
+        return
+    for submob, initial_submob in zip(family, initial_family):
+        submob.points = _copy_into(submob.points, initial_submob.points)
+        for attribute in _style_attributes:
+            if hasattr(initial_submob, attribute):
+                setattr(submob, attribute, _copy_into(getattr(submob, attribute, None), getattr(initial_submob, attribute)))
+
+def _reshape_dot(dot: Dot, initial: Dot, point=ORIGIN, **kwargs):
+    restore(dot, initial)
+    dot.move_to(point)
+
+def _reshape_line(line: Line, initial: Line, start=LEFT, end=RIGHT, **kwargs):
+    restore(line, initial)
+    line.put_start_and_end_on(
+        *( point.get_center() if isinstance(point, Mobject) else point for point in (start, end) )
+    )
+
+def _reshape_arrow(arrow: Arrow, initial: Arrow, start=LEFT, end=RIGHT, **kwargs):
+    template = getattr(initial, "_tip_template", None)
+    if template is None:
+        template = tip_template(initial)
+    if template is None:
+        return False
+    restore(arrow, initial)
+    return reshape_arrow(arrow, start, end, template)
+
+def _reshape_angle(angle: Angle, initial: Angle, line1: Line, line2: Line, radius=None, quadrant=(1, 1), other_angle=False, **kwargs):
+    if kwargs.get("elbow") or kwargs.get("dot"):
+        return False
+    restore(angle, initial)
+    arc_center, radius, start_angle, angle.angle_value = angle_arc(
+        line1.get_start(), line1.get_end(), line2.get_start(), line2.get_end(),
+        radius, quadrant, other_angle
+    )
+    angle.lines = (line1, line2)
+    angle.points = _copy_into(angle.points, arc_points(start_angle, angle.angle_value, radius, arc_center))
+
+def _reshape_decimal(decimal: DecimalNumber, initial: DecimalNumber, number=0, **kwargs):
+    # set_value rebuilds the digits at the current font size, so undo last frame's scaling first.
+    decimal.font_size = initial.font_size
+    decimal.set_value(number)
+
+# type -> (reshape function, keyword arguments it accepts changing between frames).
+# Positional arguments always go to the reshape function; other keyword arguments must
+# match the ones the instance was built with, or it is rebuilt. A reshape function
+# returns False for arguments it can't handle, which also rebuilds.
+reshapers: dict[type, tuple[Callable, set[str]]] = {
+    Dot: (_reshape_dot, { "point" }),
+    Line: (_reshape_line, { "start", "end" }),
+    Arrow: (_reshape_arrow, { "start", "end" }),
+    ReshapableArrow: (_reshape_arrow, { "start", "end" }),
+    Angle: (_reshape_angle, { "radius", "other_angle" }),
+    DecimalNumber: (_reshape_decimal, { "number" }),
+    GlyphDecimalNumber: (_reshape_decimal, { "number" }),
+}
+
+def _same_arg(a, b) -> bool:
+    if a is b:
+        return True
+    if isinstance(a, Mobject) or isinstance(b, Mobject):
+        return False
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return np.array_equal(a, b)
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return len(a) == len(b) and all( _same_arg(x, y) for x, y in zip(a, b) )
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
+
+class Instancer:
+    """
+    Passed to the function given to always_redraw_instanced as `make`. `make(cls, *args, **kwargs)`
+    builds cls(*args, **kwargs) on the first frame. On later frames the call at the same position
+    returns that same instance, reset to its freshly built state and reshaped in place for the new
+    arguments. Types without a reshaper are reused while their arguments don't change and rebuilt
+    when they do.
+    """
+    def __init__(self):
+        self.slots = []
+        self.index = 0
+
+    def begin_frame(self):
+        self.index = 0
+
+    def __call__(self, cls, *args, **kwargs):
+        index = self.index
+        self.index += 1
+        if index < len(self.slots):
+            slot_cls, slot_args, slot_kwargs, instance, initial = self.slots[index]
+            if slot_cls is cls:
+                reshape, varying = reshapers.get(cls, (None, set()))
+                fixed_kwargs_match = slot_kwargs.keys() == kwargs.keys() and all(
+                    _same_arg(value, slot_kwargs[key])
+                    for key, value in kwargs.items() if key not in varying
+                )
+                if fixed_kwargs_match and reshape is not None:
+                    if reshape(instance, initial, *args, **kwargs) is not False:
+                        return instance
+                if fixed_kwargs_match and _same_arg(args, slot_args) and _same_arg(kwargs, slot_kwargs):
+                    restore(instance, initial)
+                    return instance
+        instance = cls(*args, **kwargs)
+        slot = ( cls, args, kwargs, instance, instance.copy() )
+        if index < len(self.slots):
+            self.slots[index] = slot
+        else:
+            self.slots.append(slot)
+        return instance
+
+def always_redraw_instanced(func: Callable[[Instancer], Mobject]) -> Mobject:
+    """
+    always_redraw, but func builds its mobjects through the `make` argument, e.g.
+    `always_redraw_instanced(lambda make: make(Dot, tracker.get_value() * RIGHT).set_opacity(0.5))`.
+    The structure is built once and only updated in place afterwards.
+    """
+    make = Instancer()
+
+    def build():
+        make.begin_frame()
+        return func(make)
+
+    mob = build()
+
+    def update(mob):
+        result = build()
+        if result is mob:
+            return
+        if type(result) is type(mob) and type(mob) in (VGroup, VDict, Group):
+            # A fresh group wrapping reused instances, take its children.
+            mob.submobjects = list(result.submobjects)
+            if isinstance(mob, VDict):
+                mob.submob_dict = result.submob_dict
+        else:
+            mob.become(result)
+
+    update.__wrapped__ = func
+    mob.add_updater(update)
+    return mob
@@ -2,6 +2,7 @@ from manim import *
 import numpy as np
 
 from lib.mathutils import rotate_cc
+from lib.statehash import points_stamp
 
 class LabeledArrow(VMobject):
 
@@ -18,6 +19,7 @@ class LabeledArrow(VMobject):
         self.aligned_edge = aligned_edge
 
         self.arrow = arrow
+        self._label_stamp = None
         if isinstance(label_or_str, str):
             self.label = MathTex(label_or_str)
         else:
@@ -28,12 +30,21 @@ class LabeledArrow(VMobject):
         
         self.refresh_updaters()
 
+    def _get_arrow_stamp(self) -> tuple:
+        return ( points_stamp(self.arrow), self.alpha, self.distance, self.perp_distance, tuple(self.aligned_edge) )
+
     def position_label(self, label):
+        # Skip frames where neither the arrow nor the label moved since the label was last placed.
+        arrow_stamp = self._get_arrow_stamp()
+        if self._label_stamp == ( arrow_stamp, points_stamp(label) ):
+            return
         arrow_dir = self.arrow.get_unit_vector()
         length = self.arrow.get_length()
         position = ( self.arrow.get_start() + arrow_dir * (self.alpha * length + self.distance)
             + rotate_cc(arrow_dir) * self.perp_distance )
         label.move_to(position, aligned_edge=self.aligned_edge)
+        # Moving the label gave it new versions, the arrow's still hold.
+        self._label_stamp = ( arrow_stamp, points_stamp(label) )
 
     def refresh_updaters(self):
         self.label.clear_updaters()
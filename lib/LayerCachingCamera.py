@@ -0,0 +1,90 @@
+import itertools as it
+
+import numpy as np
+from manim import *
+
+from lib.statehash import camera_fingerprint, mobject_fingerprint
+
+class LayerCachingMixin:
+    """
+    Cairo camera mixin that keeps the bottom of the z-ordered draw list rasterized between frames.
+
+    Each frame, the longest run of mobjects at the bottom of the draw list whose points and style
+    match the previous frame is treated as a static layer. It is drawn once into a cached pixel
+    buffer, and later frames start from a copy of that buffer and only draw what is above it.
+    The cache is dropped as soon as anything in the layer, the camera frame or the starting
+    background changes, e.g. when a background plane is rotated.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._base = None
+        self._previous_fingerprints = []
+        self._layer_pixels = None
+        self._layer_key = None
+        self._layer_fingerprints = []
+
+    def reset(self):
+        self._base = None
+        return super().reset()
+
+    def set_frame_to_background(self, background):
+        # The renderer's own static frame. A new array is made whenever its content changes.
+        self._base = background
+        return super().set_frame_to_background(background)
+
+    def _stable_prefix_length(self, fingerprints: list) -> int:
+        count = 0
+        for current, previous in zip(fingerprints, self._previous_fingerprints):
+            if current != previous:
+                break
+            count += 1
+        return count
+
+    def _display(self, mobjects: list, pixel_array: np.ndarray):
+        for group_type, group in it.groupby(mobjects, self.type_or_raise):
+            self.display_funcs[group_type](list(group), pixel_array)
+
+    def fingerprint_mobjects(self, mobjects, **kwargs) -> tuple[list, list]:
+        """The mobjects capture_mobjects would draw, and their fingerprints."""
+        mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
+        return mobjects, [ mobject_fingerprint(mobject) for mobject in mobjects ]
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        self.capture_fingerprinted(*self.fingerprint_mobjects(mobjects, **kwargs))
+
+    def capture_fingerprinted(self, mobjects: list, fingerprints: list):
+        """capture_mobjects, for a draw list and fingerprints from fingerprint_mobjects."""
+        stable_count = self._stable_prefix_length(fingerprints)
+        self._previous_fingerprints = fingerprints
+
+        layer_key = ( id(self._base), camera_fingerprint(self) )
+        layer_count = len(self._layer_fingerprints)
+        layer_valid = (
+            self._layer_key == layer_key
+            and layer_count > 0
+            and fingerprints[:layer_count] == self._layer_fingerprints
+        )
+
+        if stable_count > (layer_count if layer_valid else 0):
+            # Grow or rebuild the cached layer from this frame's starting pixels.
+            if self._layer_pixels is None or self._layer_pixels.shape != self.pixel_array.shape:
+                self._layer_pixels = np.empty_like(self.pixel_array)
+            self._layer_pixels[...] = self.pixel_array
+            self._display(mobjects[:stable_count], self._layer_pixels)
+            self._layer_key = layer_key
+            self._layer_fingerprints = fingerprints[:stable_count]
+            # Keep the base alive so its id can't be reused by a different array.
+            self._layer_base = self._base
+            layer_count = stable_count
+            layer_valid = True
+
+        if layer_valid:
+            self.pixel_array[...] = self._layer_pixels
+            mobjects = mobjects[layer_count:]
+        self._display(mobjects, self.pixel_array)
+
+class LayerCachingCamera(LayerCachingMixin, Camera):
+    pass
+
+class LayerCachingMovingCamera(LayerCachingMixin, MovingCamera):
+    pass
@@ -0,0 +1,59 @@
+import numpy as np
+from manim import *
+from manim.utils.space_ops import rotation_matrix
+
+from lib.statehash import touch_points
+
+class MatrixRotate(Animation):
+    """
+    Rotate for mobjects with large families, like number planes.
+
+    Rotate is a Transform: it copies the mobject twice at the start, and every frame it
+    interpolates each submobject towards its target, builds two rotation matrices per submobject
+    and allocates new point arrays. Here the points of the whole family are gathered once into one
+    contiguous buffer, which the submobjects' points then view. Each frame builds one rotation
+    matrix and multiplies the fixed offsets from the rotation center into the buffer in place, so
+    nothing is allocated or copied after begin. Colors are left alone. The final points are what
+    `mobject.rotate(angle, axis, about_point)` gives, up to rounding.
+    """
+    def __init__(
+        self,
+        mobject: Mobject,
+        angle: float = PI,
+        axis: np.ndarray = OUT,
+        about_point: np.ndarray | None = None,
+        about_edge: np.ndarray | None = None,
+        **kwargs,
+    ):
+        self.angle = angle
+        self.axis = axis
+        if about_point is None:
+            about_point = mobject.get_center() if about_edge is None else mobject.get_critical_point(about_edge)
+        self.about_point = np.array(about_point, dtype=float)
+        super().__init__(mobject, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        # The starting points are kept in self.offsets instead of a copy of the mobject.
+        return Mobject()
+
+    def begin(self):
+        family = self.mobject.family_members_with_points()
+        self.offsets = np.concatenate([ mob.points for mob in family ] or [ np.zeros(( 0, 3 )) ]) - self.about_point
+        self.buffer = np.empty_like(self.offsets)
+        self.family = family
+        start = 0
+        for mob in family:
+            end = start + len(mob.points)
+            mob.points = self.buffer[start:end]
+            start = end
+        super().begin()
+
+    def rotation_at(self, alpha: float) -> np.ndarray:
+        return rotation_matrix(self.get_sub_alpha(alpha, 0, 1) * self.angle, self.axis)
+
+    def interpolate_mobject(self, alpha: float):
+        np.matmul(self.offsets, self.rotation_at(alpha).T, out=self.buffer)
+        self.buffer += self.about_point
+        touch_points(*self.family)
+        if config.renderer == RendererType.OPENGL:
+            self.mobject.refresh_bounding_box(recurse_down=True)
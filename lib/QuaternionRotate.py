@@ -0,0 +1,134 @@
+from functools import reduce
+
+import numpy as np
+from manim import *
+from manim.utils.space_ops import angle_axis_from_quaternion
+
+from lib.MatrixRotate import MatrixRotate
+from lib.mathutils import (
+    quaternion_mult_batch, quaternion_slerp_batch, quaternion_squad_batch,
+    quaternion_to_matrix_batch, quaternions_from_angle_axis,
+)
+
+class FrameTable:
+    """Values precomputed for every frame of an animation, looked up by the animation's alpha."""
+    def __init__(self, animation: Animation, compute):
+        self.frames = max( 1, round(animation.run_time * config.frame_rate) )
+        self.compute = compute
+        alphas = np.linspace(0, 1, self.frames + 1)
+        self.values = compute(np.array([ animation.get_sub_alpha(alpha, 0, 1) for alpha in alphas ]))
+        self.animation = animation
+
+    def __call__(self, alpha: float):
+        position = alpha * self.frames
+        index = round(position)
+        if abs(position - index) < 1e-6 and 0 <= index <= self.frames:
+            return self.values[index]
+        # Off the frame grid, e.g. a probe from another mixin.
+        return self.compute(np.array([ self.animation.get_sub_alpha(alpha, 0, 1) ]))[0]
+
+class QuaternionRotate(MatrixRotate):
+    """
+    Rotates a mobject by the product of the given quaternions, slerping from no rotation to it.
+    `QuaternionRotate(mob, q1, q2)` rotates by `quaternion_mult(q1, q2)`, i.e. by q2 then q1.
+
+    The rotation matrices for every frame are computed in one batch at begin, so a frame costs
+    one matrix product however many rotations were composed. Like MatrixRotate, the points are
+    rotated in place in one buffer for the whole family.
+    """
+    def __init__(self, mobject: Mobject, *quaternions, about_point=None, about_edge=None, **kwargs):
+        quaternion = reduce(quaternion_mult_batch, quaternions)
+        self.quaternion = quaternion / np.linalg.norm(quaternion)
+        angle, axis = angle_axis_from_quaternion(self.quaternion)
+        super().__init__(mobject, angle, axis, about_point, about_edge, **kwargs)
+
+    def begin(self):
+        identity = np.array([ 1.0, 0, 0, 0 ])
+        self.rotations = FrameTable(self, lambda alphas: quaternion_to_matrix_batch(
+            quaternion_slerp_batch(identity, self.quaternion, alphas, shortest=False)
+        ))
+        super().begin()
+
+    def rotation_at(self, alpha: float) -> np.ndarray:
+        return self.rotations(alpha)
+
+def camera_quaternions(phi, theta, gamma=0) -> np.ndarray:
+    """Quaternions of the rotation ThreeDCamera builds from phi, theta and gamma."""
+    phi, theta, gamma = np.broadcast_arrays(*( np.asarray(value, dtype=float) for value in ( phi, theta, gamma ) ))
+    return quaternion_mult_batch(
+        quaternion_mult_batch(quaternions_from_angle_axis(gamma, OUT), quaternions_from_angle_axis(-phi, RIGHT)),
+        quaternions_from_angle_axis(-theta - 90 * DEGREES, OUT),
+    )
+
+def camera_angles(matrices: np.ndarray) -> np.ndarray:
+    """(phi, theta, gamma) rows for ThreeDCamera rotation matrices, Rz(gamma) Rx(-phi) Rz(-theta - 90 degrees)."""
+    phi = np.arccos(np.clip(matrices[:, 2, 2], -1, 1))
+    gamma = np.arctan2(-matrices[:, 0, 2], matrices[:, 1, 2])
+    theta = -np.arctan2(-matrices[:, 2, 0], -matrices[:, 2, 1]) - 90 * DEGREES
+    # Looking straight along the z axis, only theta - gamma is defined. Keep gamma at 0.
+    straight = np.sin(phi) < 1e-9
+    gamma = np.where(straight, 0, gamma)
+    theta = np.where(straight, -np.arctan2(matrices[:, 1, 0], matrices[:, 0, 0]) - 90 * DEGREES, theta)
+    return np.stack([ phi, theta, gamma ], axis=-1)
+
+class CameraPath(Animation):
+    """
+    Moves a ThreeDScene's camera from its current orientation through the given (phi, theta) or
+    (phi, theta, gamma) orientations, e.g. `self.play(CameraPath(self.camera, (75*DEGREES, 145*DEGREES)))`.
+
+    move_camera interpolates the Euler angles, which swings the view around when theta or gamma
+    change along with phi. Here the orientations are interpolated as quaternions, with slerp
+    between two of them and squad through more, so the camera turns along the shortest arc at
+    an even rate. The angles for every frame are computed in one batch at begin.
+    """
+    def __init__(self, camera, *orientations, **kwargs):
+        self.camera = camera
+        self.orientations = [ tuple(orientation) + ( 0, ) * (3 - len(orientation)) for orientation in orientations ]
+        if config.renderer == RendererType.OPENGL:
+            mobject = camera
+        else:
+            mobject = Group(camera.phi_tracker, camera.theta_tracker, camera.gamma_tracker)
+        super().__init__(mobject, **kwargs)
+
+    def get_orientation(self) -> tuple:
+        if config.renderer == RendererType.OPENGL:
+            theta, phi, gamma = self.camera.euler_angles
+            return phi, theta, gamma
+        return self.camera.get_phi(), self.camera.get_theta(), self.camera.get_gamma()
+
+    def set_orientation(self, phi: float, theta: float, gamma: float):
+        if config.renderer == RendererType.OPENGL:
+            self.camera.set_euler_angles(theta, phi, gamma)
+        else:
+            self.camera.set_phi(phi)
+            self.camera.set_theta(theta)
+            self.camera.set_gamma(gamma)
+
+    def _angles(self, alphas: np.ndarray) -> np.ndarray:
+        angles = camera_angles(quaternion_to_matrix_batch(quaternion_squad_batch(self.keys, alphas)))
+        # Angles come back in (-pi, pi]. Shift theta and gamma by whole turns to continue from the start.
+        start = np.array(self.key_angles[0])
+        angles[:, 1:] = np.unwrap(np.concatenate([ start[None, 1:], angles[:, 1:] ]), axis=0)[1:]
+        return angles
+
+    def begin(self):
+        self.key_angles = [ self.get_orientation(), *self.orientations ]
+        self.keys = camera_quaternions(*np.transpose(self.key_angles))
+        self.angles = FrameTable(self, self._angles)
+        # Where a frame shows a keyframe, use its angles as given rather than a whole turn off.
+        for row in [ 0, -1 ]:
+            for key in [ self.key_angles[0], self.key_angles[-1] ]:
+                turns = (self.angles.values[row] - key) / TAU
+                if np.allclose(turns[0], 0, atol=1e-6) and np.allclose(turns[1:], np.round(turns[1:]), atol=1e-6):
+                    self.angles.values[row] = key
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        self.set_orientation(*self.angles(alpha))
+
+    def clean_up_from_scene(self, scene: Scene):
+        super().clean_up_from_scene(scene)
+        # Don't leave the camera's trackers in the scene, where they would make ThreeDScene
+        # redraw everything on later plays. move_camera does the same with the frame center.
+        if config.renderer != RendererType.OPENGL:
+            scene.remove(self.mobject)
@@ -0,0 +1,70 @@
+from manim import *
+import numpy as np
+
+from lib.statehash import touch_points
+
+def tip_template(arrow: Arrow) -> np.ndarray | None:
+    """
+    Points of arrow's tip relative to its tip point, rotated to point along +x and scaled to unit
+    length. None when the tip doesn't lie flat in the xy-plane.
+    """
+    tip = arrow.tip
+    vector = tip.tip_point - tip.base
+    length = np.linalg.norm(vector)
+    if length == 0 or abs(vector[2]) > 1e-9:
+        return None
+    c, s = vector[:2] / length
+    to_x_axis = np.array([ [ c, s, 0 ], [ -s, c, 0 ], [ 0, 0, 1 ] ])
+    return (tip.points - tip.tip_point) @ to_x_axis.T / length
+
+def reshape_arrow(arrow: Arrow, start, end, template: np.ndarray) -> bool:
+    """
+    Puts arrow's line and tip where Arrow(start, end, ...) with the same settings would put them,
+    writing into the existing point arrays. Tip length and stroke width follow the new length as in
+    Arrow. Returns False when that isn't possible, for mobject endpoints, arcs, arrows leaving the
+    xy-plane or zero length.
+    """
+    if isinstance(start, Mobject) or isinstance(end, Mobject) or arrow.path_arc:
+        return False
+    start = np.array(start, dtype=float)
+    end = np.array(end, dtype=float)
+    vector = end - start
+    length = np.linalg.norm(vector)
+    if length == 0 or vector[2] != 0 or arrow.points.shape != (4, 3) or arrow.tip.points.shape != template.shape:
+        return False
+    unit = vector / length
+
+    arrow.start, arrow.end = start, end
+    if arrow.buff and length >= 2 * arrow.buff:
+        start = start + unit * arrow.buff
+        end = end - unit * arrow.buff
+        length -= 2 * arrow.buff
+
+    tip_length = min(arrow.tip_length, arrow.max_tip_length_to_length_ratio * length)
+    c, s = unit[:2]
+    rotation = np.array([ [ c, -s, 0 ], [ s, c, 0 ], [ 0, 0, 1 ] ])
+    arrow.tip.points[...] = end + (template * tip_length) @ rotation.T
+
+    base = end - unit * tip_length
+    arrow.points[...] = start + np.outer([ 0, 1 / 3, 2 / 3, 1 ], base - start)
+    touch_points(arrow, arrow.tip)
+    arrow.set_stroke(width=min(arrow.initial_stroke_width, arrow.max_stroke_width_to_length_ratio * length), family=False)
+    return True
+
+class ReshapableArrow(Arrow):
+    """
+    Arrow whose ends can be moved every frame without rebuilding it. set_start_and_end rewrites
+    the line and tip points in place, with the tip size and stroke width an Arrow of the new
+    length would have.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._init_args = ( args, kwargs )
+        self._tip_template = tip_template(self)
+
+    def set_start_and_end(self, start, end):
+        if self._tip_template is None or not reshape_arrow(self, start, end, self._tip_template):
+            args, kwargs = self._init_args
+            kwargs = { key: value for key, value in kwargs.items() if key not in ( "start", "end" ) }
+            self.become(Arrow(start, end, *args[2:], **kwargs))
+        return self
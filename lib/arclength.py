@@ -0,0 +1,74 @@
+"""
+point_from_proportion with the curve lengths measured once per shape instead of on every call.
+
+VMobject.point_from_proportion samples every curve to measure it each time it's asked for a
+point. Here the cumulative lengths are kept on the mobject, keyed by its points_version (see
+lib/statehash), which changes whenever its points are set, so they are only measured again
+after the points change. A lookup is then a binary search and one Bezier evaluation. Lengths
+are measured the same way manim does, cubic curves for Cairo and quadratic ones for OpenGL, so
+the points match point_from_proportion's.
+"""
+import numpy as np
+from manim import *
+
+from lib.statehash import points_version
+
+# Samples per curve, as in VMobject.get_nth_curve_length_pieces.
+SAMPLE_POINTS = 10
+
+def _bezier_points(controls: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Cubic or quadratic Bezier curves with controls (n, 4 or 3, 3) evaluated at t (n,) or (n, samples)."""
+    t = t[..., None]
+    s = 1 - t
+    if t.ndim == 3:
+        controls = controls[:, :, None, :]
+    if controls.shape[1] == 3:
+        return s ** 2 * controls[:, 0] + 2 * t * s * controls[:, 1] + t ** 2 * controls[:, 2]
+    return (
+        s ** 3 * controls[:, 0] + 3 * t * s ** 2 * controls[:, 1]
+        + 3 * s * t ** 2 * controls[:, 2] + t ** 3 * controls[:, 3]
+    )
+
+def _curve_controls(vmob: VMobject) -> np.ndarray:
+    nppc = vmob.n_points_per_curve
+    num_curves = len(vmob.points) // nppc
+    return vmob.points[:num_curves * nppc].reshape(num_curves, nppc, 3)
+
+def arc_length_table(vmob: VMobject) -> np.ndarray:
+    """Cumulative arc length at the start of each curve of vmob, plus the total at the end."""
+    stamp = points_version(vmob)
+    cached = getattr(vmob, "_arc_length_table", None)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    controls = _curve_controls(vmob)
+    samples = _bezier_points(controls, np.broadcast_to(np.linspace(0, 1, SAMPLE_POINTS), (len(controls), SAMPLE_POINTS)))
+    lengths = np.linalg.norm(np.diff(samples, axis=1), axis=2).sum(axis=1)
+    table = np.concatenate([ [ 0 ], np.cumsum(lengths) ])
+    vmob._arc_length_table = ( stamp, table )
+    return table
+
+def points_from_proportions(vmob: VMobject, alphas) -> np.ndarray:
+    """VMobject.point_from_proportion for every alpha in one call, as an (n, 3) array."""
+    alphas = np.asarray(alphas, dtype=float)
+    if np.any(alphas < 0) or np.any(alphas > 1):
+        raise ValueError(f"Alphas {alphas} not all between 0 and 1.")
+    vmob.throw_error_if_no_points()
+    table = arc_length_table(vmob)
+    controls = _curve_controls(vmob)
+    targets = alphas * table[-1]
+    # First curve whose end reaches the target, like the linear scan in point_from_proportion.
+    curves = np.minimum(np.searchsorted(table[1:], targets, side="left"), len(controls) - 1)
+    lengths = table[curves + 1] - table[curves]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        residues = np.where(lengths != 0, (targets - table[curves]) / lengths, 0)
+    points = _bezier_points(controls[curves], residues)
+    points[alphas == 1] = vmob.points[-1]
+    return points
+
+def point_from_proportion(vmob: VMobject, alpha: float) -> np.ndarray:
+    return points_from_proportions(vmob, [ alpha ])[0]
+
+class CachedMoveAlongPath(MoveAlongPath):
+    """MoveAlongPath looking its points up in the path's arc-length table."""
+    def interpolate_mobject(self, alpha: float):
+        self.mobject.move_to(point_from_proportion(self.path, self.rate_func(alpha)))
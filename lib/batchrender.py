@@ -0,0 +1,147 @@
+"""
+Renders every scene in one or more scene modules, in parallel.
+
+Scenes are the Scene subclasses defined in each module, minus those with an `# Unused` comment
+right above their class statement. Each scene renders in its own worker process, at most one
+per core, with the renderer chosen per scene. Workers share the on-disk tex cache (lib/texcache)
+and manim's tex directory, and by default the tex is compiled ahead of time with lib/prewarm so
+workers don't race to typeset the same expressions.
+
+Usage, from the repository root:
+```
+python -m lib.batchrender complex.py quaternions.py -q h [--opengl ThreeD ThreeDPart2] [--jobs 4]
+```
+"""
+import argparse
+import inspect
+import multiprocessing
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from manim import *
+
+from lib import texcache
+from lib.prewarm import load_module, prewarm, scene_classes
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+class RenderJob:
+    def __init__(self, path: str, scene_name: str, renderer: str = "cairo"):
+        self.path = path
+        self.scene_name = scene_name
+        self.renderer = renderer
+
+class RenderResult:
+    def __init__(self, job: RenderJob, wall_time: float, frames: int = 0, output: str | None = None, error: str | None = None):
+        self.job = job
+        self.wall_time = wall_time
+        self.frames = frames
+        self.output = output
+        self.error = error
+
+def is_unused(scene_class: type) -> bool:
+    comments = inspect.getcomments(scene_class) or ""
+    return "unused" in comments.lower()
+
+def find_jobs(paths: list[str], scene_names: list[str] | None = None, opengl_scenes: list[str] = (), renderer="cairo") -> list[RenderJob]:
+    jobs = []
+    for path in paths:
+        for cls in scene_classes(load_module(path)):
+            if scene_names is not None and cls.__name__ not in scene_names:
+                continue
+            if scene_names is None and is_unused(cls):
+                continue
+            scene_renderer = "opengl" if cls.__name__ in opengl_scenes else renderer
+            jobs.append( RenderJob(path, cls.__name__, scene_renderer) )
+    return jobs
+
+def load_job_scene(job: RenderJob, quality: str) -> type:
+    """Configures manim for job and returns its scene class. Needs a fresh process, since scene modules read config.renderer at import time."""
+    config.renderer = job.renderer
+    config.quality = QUALITIES[quality]
+    config.write_to_movie = True
+    config.preview = False
+    return getattr(load_module(job.path), job.scene_name)
+
+def render_job(job: RenderJob, quality: str) -> RenderResult:
+    start = time.perf_counter()
+    try:
+        scene = load_job_scene(job, quality)()
+        scene.render()
+        file_writer = scene.renderer.file_writer
+        return RenderResult(
+            job, time.perf_counter() - start,
+            frames=round(scene.renderer.time * config.frame_rate),
+            output=str(getattr(file_writer, "movie_file_path", None) or file_writer.image_file_path),
+        )
+    except Exception:
+        return RenderResult(job, time.perf_counter() - start, error=traceback.format_exc())
+
+def render_all(jobs: list[RenderJob], quality: str = "l", workers: int | None = None) -> list[RenderResult]:
+    workers = min( workers or os.cpu_count() or 1, len(jobs) ) or 1
+    # Pin the tex cache to one absolute directory, so every worker reads and writes the same one.
+    cache_dir = texcache.cache_dir()
+    if cache_dir is not None:
+        os.environ["MANIM_TEX_GEOMETRY_CACHE"] = os.path.abspath(cache_dir)
+    results = {}
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=1,
+    ) as executor:
+        futures = [ executor.submit(render_job, job, quality) for job in jobs ]
+        for future in as_completed(futures):
+            result = future.result()
+            status = "failed" if result.error else "done"
+            logger.info(f"{result.job.scene_name}: {status} in {result.wall_time:.1f}s")
+            results[future] = result
+    return [ results[future] for future in futures ]
+
+def format_summary(results: list[RenderResult]) -> str:
+    rows = [ ( "Scene", "Renderer", "Wall time", "Frames", "Output" ) ]
+    for result in results:
+        rows.append( (
+            f"{os.path.basename(result.job.path)}:{result.job.scene_name}",
+            result.job.renderer,
+            f"{result.wall_time:.1f}s",
+            str(result.frames) if not result.error else "-",
+            result.output if not result.error else "FAILED",
+        ) )
+    widths = [ max( len(row[i]) for row in rows ) for i in range(len(rows[0])) ]
+    lines = [ "  ".join( cell.ljust(width) for cell, width in zip(row, widths) ).rstrip() for row in rows ]
+    lines.insert(1, "  ".join( "-" * width for width in widths ))
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Render every scene in the given modules in parallel.")
+    parser.add_argument("files", nargs="+")
+    parser.add_argument("-q", "--quality", choices=QUALITIES.keys(), default="l")
+    parser.add_argument("--scenes", nargs="*", help="Only render these scenes, including unused ones.")
+    parser.add_argument("--renderer", choices=[ "cairo", "opengl" ], default="cairo", help="Default renderer.")
+    parser.add_argument("--opengl", nargs="*", default=[], help="Scenes to render with OpenGL.")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: one per core).")
+    parser.add_argument("--no-prewarm", action="store_true", help="Skip compiling the tex ahead of time.")
+    args = parser.parse_args()
+
+    jobs = find_jobs(args.files, args.scenes, args.opengl, args.renderer)
+    if not args.no_prewarm:
+        prewarm(args.files, [ job.scene_name for job in jobs ], args.jobs)
+
+    start = time.perf_counter()
+    results = render_all(jobs, args.quality, args.jobs)
+    print(format_summary(results))
+    print(f"Rendered {len(results)} scenes in {time.perf_counter() - start:.1f}s")
+    for result in results:
+        if result.error:
+            print(f"\n{result.job.scene_name} failed:\n{result.error}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Geometry computed straight from points, without building mobjects."""
+import numpy as np
+from manim import *
+
+def arc_points(start_angle: float, angle: float, radius: float = 1, arc_center=ORIGIN, num_components: int = 9) -> np.ndarray:
+    """Cubic Bezier points of Arc(radius, start_angle, angle, arc_center=arc_center)."""
+    angles = np.linspace(start_angle, start_angle + angle, num_components)
+    anchors = np.zeros((num_components, 3))
+    anchors[:, 0] = np.cos(angles)
+    anchors[:, 1] = np.sin(angles)
+    tangent_vectors = np.zeros(anchors.shape)
+    tangent_vectors[:, 1] = anchors[:, 0]
+    tangent_vectors[:, 0] = -anchors[:, 1]
+    d_theta = angle / (num_components - 1.0)
+    points = np.zeros((4 * (num_components - 1), 3))
+    points[0::4] = anchors[:-1]
+    points[1::4] = anchors[:-1] + (d_theta / 3) * tangent_vectors[:-1]
+    points[2::4] = anchors[1:] - (d_theta / 3) * tangent_vectors[1:]
+    points[3::4] = anchors[1:]
+    return points * radius + arc_center
+
+def angle_arc(line1_start, line1_end, line2_start, line2_end, radius=None, quadrant=(1, 1), other_angle=False):
+    """Returns (arc_center, radius, start_angle, angle) of Angle(line1, line2, ...) for the non-elbow case."""
+    line1_start, line1_end, line2_start, line2_end = map(np.asarray, (line1_start, line1_end, line2_start, line2_end))
+    inter = line_intersection([line1_start, line1_end], [line2_start, line2_end])
+
+    if radius is None:
+        dist_1 = np.linalg.norm((line1_end if quadrant[0] == 1 else line1_start) - inter)
+        dist_2 = np.linalg.norm((line2_end if quadrant[1] == 1 else line2_start) - inter)
+        if np.minimum(dist_1, dist_2) < 0.6:
+            radius = (2 / 3) * np.minimum(dist_1, dist_2)
+        else:
+            radius = 0.4
+
+    angle_1 = angle_of_vector(quadrant[0] * radius * normalize(line1_end - line1_start))
+    angle_2 = angle_of_vector(quadrant[1] * radius * normalize(line2_end - line2_start))
+
+    if not other_angle:
+        if angle_2 > angle_1:
+            angle = angle_2 - angle_1
+        else:
+            angle = 2 * np.pi - (angle_1 - angle_2)
+    else:
+        if angle_2 < angle_1:
+            angle = -angle_1 + angle_2
+        else:
+            angle = -2 * np.pi + (angle_2 - angle_1)
+
+    return inter, radius, angle_1, angle
+
+# Vectorized queries. Arguments broadcast against each other, so a single point or direction
+# can be paired with many, and each returns one row per input.
+
+def arc_midpoints(arc_centers, radii, start_angles, angles) -> np.ndarray:
+    """Midpoints of arcs, i.e. Arc(...).point_from_proportion(0.5) for each."""
+    middle = np.asarray(start_angles) + np.asarray(angles) / 2
+    radii = np.asarray(radii)[..., None]
+    return np.asarray(arc_centers) + radii * np.stack([ np.cos(middle), np.sin(middle), np.zeros_like(middle) ], axis=-1)
+
+def line_intersections(line1_starts, line1_ends, line2_starts, line2_ends) -> np.ndarray:
+    """Intersections of lines in the xy-plane. Rows for parallel lines are inf or nan."""
+    p, r = np.asarray(line1_starts)[..., :2], np.asarray(line1_ends)[..., :2] - np.asarray(line1_starts)[..., :2]
+    q, s = np.asarray(line2_starts)[..., :2], np.asarray(line2_ends)[..., :2] - np.asarray(line2_starts)[..., :2]
+    denominator = np.cross(r, s)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.cross(q - p, s) / denominator
+    points = p + t[..., None] * r
+    return np.concatenate([ points, np.zeros(points.shape[:-1] + (1,)) ], axis=-1)
+
+def angle_arcs(line1_starts, line1_ends, line2_starts, line2_ends, radius=None, quadrant=(1, 1), other_angle=False):
+    """angle_arc for many line pairs at once. Returns arrays (arc_centers, radii, start_angles, angles)."""
+    line1_starts, line1_ends, line2_starts, line2_ends = np.broadcast_arrays(
+        *( np.asarray(points, dtype=float) for points in (line1_starts, line1_ends, line2_starts, line2_ends) )
+    )
+    inter = line_intersections(line1_starts, line1_ends, line2_starts, line2_ends)
+
+    if radius is None:
+        dist_1 = np.linalg.norm((line1_ends if quadrant[0] == 1 else line1_starts) - inter, axis=-1)
+        dist_2 = np.linalg.norm((line2_ends if quadrant[1] == 1 else line2_starts) - inter, axis=-1)
+        shortest = np.minimum(dist_1, dist_2)
+        radii = np.where(shortest < 0.6, (2 / 3) * shortest, 0.4)
+    else:
+        radii = np.broadcast_to(np.asarray(radius, dtype=float), inter.shape[:-1])
+
+    direction_1 = quadrant[0] * (line1_ends - line1_starts)
+    direction_2 = quadrant[1] * (line2_ends - line2_starts)
+    angle_1 = np.arctan2(direction_1[..., 1], direction_1[..., 0])
+    angle_2 = np.arctan2(direction_2[..., 1], direction_2[..., 0])
+
+    if not other_angle:
+        angles = np.where(angle_2 > angle_1, angle_2 - angle_1, 2 * np.pi - (angle_1 - angle_2))
+    else:
+        angles = np.where(angle_2 < angle_1, angle_2 - angle_1, -2 * np.pi + (angle_2 - angle_1))
+    return inter, radii, angle_1, angles
+
+def angle_midpoints(line1_starts, line1_ends, line2_starts, line2_ends, radius=None, **kwargs) -> np.ndarray:
+    """Angle(line1, line2, radius=radius, ...).point_from_proportion(0.5) for many line pairs, without building any Angle."""
+    return arc_midpoints(*angle_arcs(line1_starts, line1_ends, line2_starts, line2_ends, radius, **kwargs))
+
+def angle_bisectors(directions_1, directions_2, other_angle=False) -> np.ndarray:
+    """Unit vectors halving the counterclockwise angle from each direction_1 to direction_2 (clockwise with other_angle)."""
+    directions_1 = np.asarray(directions_1, dtype=float)
+    directions_2 = np.asarray(directions_2, dtype=float)
+    angle_1 = np.arctan2(directions_1[..., 1], directions_1[..., 0])
+    angle_2 = np.arctan2(directions_2[..., 1], directions_2[..., 0])
+    sweep = np.mod(angle_2 - angle_1, 2 * np.pi)
+    if other_angle:
+        sweep = sweep - 2 * np.pi
+    middle = angle_1 + sweep / 2
+    return np.stack([ np.cos(middle), np.sin(middle), np.zeros_like(middle) ], axis=-1)
+
+def offsets(from_points, to_points, mask=(1, 1, 1)) -> np.ndarray:
+    """Shift taking each from_point onto its to_point, restricted to the masked axes, e.g. RIGHT for x only."""
+    return (np.asarray(to_points) - np.asarray(from_points)) * np.asarray(mask)
+
+def next_to_centers(target_centers, target_half_sizes, half_sizes, directions, buff=DEFAULT_MOBJECT_TO_MOBJECT_BUFFER, aligned_edge=ORIGIN) -> np.ndarray:
+    """
+    Where next_to(target, direction, buff, aligned_edge) would put the center of a mobject with the
+    given half width/height/depth, from the target's bounding box center and half sizes.
+    """
+    directions = np.asarray(directions, dtype=float)
+    aligned_edge = np.asarray(aligned_edge, dtype=float)
+    return (
+        np.asarray(target_centers) + np.asarray(target_half_sizes) * np.sign(aligned_edge + directions)
+        - np.asarray(half_sizes) * np.sign(aligned_edge - directions) + buff * directions
+    )
@@ -0,0 +1,92 @@
+"""
+Level of detail for tessellated 3D mobjects.
+
+Surfaces like Arrow3D's cylinder and cone are tessellated at a fixed resolution, 24x24 and 32x32
+faces, whatever the output quality and however small they are on screen. Under cairo every face is
+a VMobject that is built, shaded and depth sorted, so an arrow costs some 1600 of them. Here the
+resolution is chosen so that each face spans a few pixels on screen at the configured quality,
+within the stock resolution, and the meshes are cached per resolution so equal arrows are copied
+rather than tessellated again.
+"""
+import math
+
+import numpy as np
+from manim import *
+
+# Screen size of a face along the tessellated direction, in pixels.
+PIXELS_PER_SEGMENT = 4
+
+def pixels_per_unit(camera: Camera | None = None) -> float:
+    """Pixels per scene unit at the camera's zoom, or at the configured quality without a camera."""
+    if camera is None:
+        return config.pixel_height / config.frame_height
+    zoom = camera.get_zoom() if hasattr(camera, "get_zoom") else 1
+    return camera.pixel_height / camera.frame_height * zoom
+
+def lod_segments(extent: float, max_segments: int, min_segments: int = 1, camera: Camera | None = None) -> int:
+    """
+    Segments for a parameter sweeping `extent` scene units on screen, e.g. TAU * radius around a
+    circle. Perspective is ignored, so this is the size at the camera's focal plane.
+    """
+    segments = math.ceil(extent * pixels_per_unit(camera) / PIXELS_PER_SEGMENT)
+    return int(np.clip(segments, min_segments, max_segments))
+
+def surface_resolution(u_segments: int, v_segments: int) -> tuple[int, int]:
+    """The resolution argument giving these many faces. OpenGL surfaces count samples instead."""
+    if config.renderer == RendererType.OPENGL:
+        return u_segments + 1, v_segments + 1
+    return u_segments, v_segments
+
+def arrow3d_resolution(base_radius: float = 0.08, camera: Camera | None = None) -> tuple[int, int]:
+    """
+    Resolution for an Arrow3D, whose cylinder and cone share it. Around the axis it follows the
+    tip's circumference on screen, up to the cone's stock 32. Both surfaces are straight along the
+    axis, so faces there only help depth sorting and a quarter as many are used.
+    """
+    around = lod_segments(TAU * base_radius, 32, 6, camera)
+    return surface_resolution(max(1, around // 4), around)
+
+_arrow_meshes = {}
+
+def lod_arrow3d(
+    start: np.ndarray = LEFT,
+    end: np.ndarray = RIGHT,
+    thickness: float = 0.02,
+    height: float = 0.3,
+    base_radius: float = 0.08,
+    color: ParsableManimColor = WHITE,
+    camera: Camera | None = None,
+    **kwargs,
+) -> Arrow3D:
+    """
+    An Arrow3D from start to end tessellated at arrow3d_resolution, unless a resolution is given.
+
+    Arrows are built pointing up from the origin, cached by length, shape, color and resolution,
+    and copied, rotated and shifted into place the way Cylinder and Cone orient themselves.
+    """
+    start, end = np.array(start, dtype=float), np.array(end, dtype=float)
+    kwargs.setdefault("resolution", arrow3d_resolution(base_radius, camera))
+    vect = end - start
+    length = np.linalg.norm(vect)
+    key = (
+        config.renderer, float(length), thickness, height, base_radius, ManimColor(color).to_hex(),
+        *sorted( ( name, repr(value) ) for name, value in kwargs.items() ),
+    )
+    if key not in _arrow_meshes:
+        _arrow_meshes[key] = Arrow3D(ORIGIN, length * OUT, thickness, height, base_radius, color, **kwargs)
+    arrow = _arrow_meshes[key].copy()
+
+    direction = normalize(vect)
+    theta = np.arccos(np.clip(direction[2], -1, 1))
+    phi = np.arctan2(direction[1], direction[0])
+    rotation = rotation_matrix(phi, OUT) @ rotation_matrix(theta, UP)
+    arrow.rotate(theta, UP, about_point=ORIGIN).rotate(phi, OUT, about_point=ORIGIN).shift(start)
+
+    arrow.start = start + rotation @ arrow.start
+    arrow.end = start + rotation @ arrow.end
+    arrow.vect = arrow.end - arrow.start
+    for part in [ arrow, arrow.cone ]:
+        part.direction = direction
+        part._current_theta = theta
+        part._current_phi = phi
+    return arrow
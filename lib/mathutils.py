@@ -51,6 +51,140 @@ def rotate_vec_by_quat(vec, quat):
         quat_inv
     )[1:]
 
+# Batch versions of the quaternion helpers above. Quaternions are (..., 4) arrays in
+# (w, x, y, z) order and vectors are (..., 3) arrays; leading dimensions broadcast,
+# so a single quaternion can be applied to a whole (N, 3) point set.
+
+def quaternion_mult_batch( q1, q2 ):
+    w1, x1, y1, z1 = np.moveaxis( np.asarray(q1, dtype=float), -1, 0 )
+    w2, x2, y2, z2 = np.moveaxis( np.asarray(q2, dtype=float), -1, 0 )
+    return np.stack([
+        w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+        w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+        w1 * y2 + y1 * w2 + z1 * x2 - x1 * z2,
+        w1 * z2 + z1 * w2 + x1 * y2 - y1 * x2,
+    ], axis=-1)
+
+def quaternion_conjugate_batch( quats ):
+    result = np.array(quats, dtype=float)
+    result[..., 1:] *= -1
+    return result
+
+def quaternion_to_matrix_batch( quats ):
+    """Rotation matrices (..., 3, 3) for unit quaternions (..., 4)."""
+    w, x, y, z = np.moveaxis( np.asarray(quats, dtype=float), -1, 0 )
+    return np.stack([
+        np.stack([ 1 - 2 * (y*y + z*z), 2 * (x*y - w*z), 2 * (x*z + w*y) ], axis=-1),
+        np.stack([ 2 * (x*y + w*z), 1 - 2 * (x*x + z*z), 2 * (y*z - w*x) ], axis=-1),
+        np.stack([ 2 * (x*z - w*y), 2 * (y*z + w*x), 1 - 2 * (x*x + y*y) ], axis=-1),
+    ], axis=-2)
+
+def rotate_vecs_by_quats( vecs, quats ):
+    """Batch rotate_vec_by_quat. Expands q v q* as v + 2w(u x v) + 2u x (u x v),
+    which is the same rotation for unit quaternions without the two full products."""
+    vecs = np.asarray(vecs, dtype=float)
+    quats = np.asarray(quats, dtype=float)
+    w = quats[..., :1]
+    u = quats[..., 1:]
+    t = 2 * np.cross(u, vecs)
+    return vecs + w * t + np.cross(u, t)
+
+def rotate_points_by_quat( points, quat ):
+    """Rotates an (N, 3) point set by a single quaternion with one matrix product."""
+    return np.asarray(points, dtype=float) @ quaternion_to_matrix_batch(quat).T
+
+def relative_quaternions( v1, v2, fallback_axis=None ):
+    """Batch relative_quaternion. Rows where v1 and v2 are opposite use fallback_axis if given."""
+    v1 = np.asarray(v1, dtype=float)
+    mid = v1 + np.asarray(v2, dtype=float)
+    mid = mid / np.linalg.norm(mid, axis=-1, keepdims=True)
+    dot = np.sum(v1 * mid, axis=-1, keepdims=True)
+    result = np.concatenate([ dot, np.cross(v1, mid) ], axis=-1)
+    if not fallback_axis is None:
+        epsilon = 0.00001
+        fallback = np.concatenate([
+            np.zeros(np.shape(fallback_axis)[:-1] + (1,)),
+            np.asarray(fallback_axis, dtype=float)
+        ], axis=-1)
+        result = np.where( np.abs( dot + 1 ) < epsilon, fallback, result )
+    return result
+
+def relative_quaternions2( forward1, up1, forward2, up2 ):
+    """Batch relative_quaternion2."""
+    forward_quat = relative_quaternions(forward1, forward2)
+    up1_by_forward_quat = rotate_vecs_by_quats(up1, forward_quat)
+    up_quat = relative_quaternions( up1_by_forward_quat, up2, fallback_axis=forward2 )
+    return quaternion_mult_batch( up_quat, forward_quat )
+
+def quaternions_from_angle_axis( angles, axes ):
+    """Batch quaternion_from_angle_axis. Axes need not be normalized."""
+    angles = np.asarray(angles, dtype=float)[..., None]
+    axes = np.asarray(axes, dtype=float)
+    axes = axes / np.linalg.norm(axes, axis=-1, keepdims=True)
+    return np.concatenate([ np.cos(angles / 2), np.sin(angles / 2) * axes ], axis=-1)
+
+def quaternion_slerp_batch( q1, q2, t, shortest=True ):
+    """Spherical interpolation from unit quaternions q1 to q2 at each t. With shortest, q2 is
+    negated where needed so the rotation goes the short way around."""
+    q1 = np.asarray(q1, dtype=float)
+    q2 = np.asarray(q2, dtype=float)
+    t = np.asarray(t, dtype=float)[..., None]
+    dot = np.sum(q1 * q2, axis=-1, keepdims=True)
+    if shortest:
+        q2 = np.where(dot < 0, -q2, q2)
+        dot = np.abs(dot)
+    angle = np.arccos(np.clip(dot, -1, 1))
+    sin = np.sin(angle)
+    close = sin < 1e-6
+    safe_sin = np.where(close, 1, sin)
+    w1 = np.where(close, 1 - t, np.sin((1 - t) * angle) / safe_sin)
+    w2 = np.where(close, t, np.sin(t * angle) / safe_sin)
+    result = w1 * q1 + w2 * q2
+    return result / np.linalg.norm(result, axis=-1, keepdims=True)
+
+def quaternion_log_batch( quats ):
+    """Logarithms (0, axis * half angle) of unit quaternions."""
+    quats = np.asarray(quats, dtype=float)
+    vector = quats[..., 1:]
+    sin = np.linalg.norm(vector, axis=-1, keepdims=True)
+    half_angle = np.arctan2(sin, quats[..., :1])
+    scale = np.where(sin < 1e-12, 1, half_angle / np.where(sin < 1e-12, 1, sin))
+    return np.concatenate([ np.zeros_like(sin), vector * scale ], axis=-1)
+
+def quaternion_exp_batch( quats ):
+    """Inverse of quaternion_log_batch, for quaternions with zero real part."""
+    vector = np.asarray(quats, dtype=float)[..., 1:]
+    angle = np.linalg.norm(vector, axis=-1, keepdims=True)
+    scale = np.where(angle < 1e-12, 1, np.sin(angle) / np.where(angle < 1e-12, 1, angle))
+    return np.concatenate([ np.cos(angle), vector * scale ], axis=-1)
+
+def quaternion_squad_batch( keys, t ):
+    """Smooth interpolation through evenly spaced unit quaternion keyframes, with t in [0, 1]
+    running over all of them. Two keyframes give plain slerp."""
+    keys = np.array(keys, dtype=float)
+    # Keep each keyframe on the same side as the one before, so segments go the short way.
+    for i in range(1, len(keys)):
+        if np.dot(keys[i], keys[i - 1]) < 0:
+            keys[i] *= -1
+    previous = np.concatenate([ keys[:1], keys[:-1] ])
+    following = np.concatenate([ keys[1:], keys[-1:] ])
+    inverse = quaternion_conjugate_batch(keys)
+    tangents = quaternion_mult_batch(keys, quaternion_exp_batch(-(
+        quaternion_log_batch(quaternion_mult_batch(inverse, following))
+        + quaternion_log_batch(quaternion_mult_batch(inverse, previous))
+    ) / 4))
+    # Ease in and out of the first and last keyframes.
+    tangents[0], tangents[-1] = keys[0], keys[-1]
+
+    position = np.clip(np.asarray(t, dtype=float), 0, 1) * (len(keys) - 1)
+    index = np.minimum(position.astype(int), max(len(keys) - 2, 0))
+    u = position - index
+    if len(keys) == 1:
+        return np.broadcast_to(keys[0], u.shape + (4,)).copy()
+    curve = quaternion_slerp_batch(keys[index], keys[index + 1], u, shortest=False)
+    control = quaternion_slerp_batch(tangents[index], tangents[index + 1], u, shortest=False)
+    return quaternion_slerp_batch(curve, control, 2 * u * (1 - u), shortest=False)
+
 # print("\n=Tests===")
 # print(relative_quaternion(
 #     np.array([1, 0, 0]),
@@ -0,0 +1,318 @@
+"""
+Compiles every tex expression a scene module needs before rendering it.
+
+Expressions are collected two ways:
+ - statically, by evaluating the literal arguments of MathTex/Tex/math_tex/colored_math_tex
+   call sites in the module's global namespace, and
+ - with a dry-run of each scene's construct, where tex compilation is replaced by a recorder
+   that hands back placeholder glyphs. Rounds repeat until no new expressions turn up, since a
+   scene may only reach later tex once earlier tex has real geometry.
+
+Missing expressions are then typeset as multi-page documents, one page per expression, so
+latex and dvisvgm start once per batch, with the batches run in parallel. Pages are written
+where manim's tex_to_svg_file looks for them, so the real render does no TeX work. For each tex
+template, the first two expressions are typeset both ways and their geometry compared first; if
+the pages don't match tex_to_svg_file's output, that template's expressions are compiled one at a
+time instead.
+
+Usage, from the repository root:
+```
+python -m lib.prewarm complex.py quaternions.py [--scenes Intro ThreeD] [--jobs 8]
+```
+"""
+import argparse
+import ast
+import importlib.util
+import inspect
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+from manim import *
+import manim.mobject.text.tex_mobject as tex_mobject
+from manim.utils.tex_file_writing import generate_tex_file, tex_to_svg_file
+
+from lib import texcache
+
+TEX_BUILDERS = { "MathTex", "Tex", "math_tex", "colored_math_tex", "compose_colored_tex", "cached_math_tex" }
+PAGE_ENVIRONMENT = "manimprewarmpage"
+
+# Template key -> whether batched pages matched tex_to_svg_file's output for it.
+batching_verified = {}
+
+def load_module(path: str):
+    path = os.path.abspath(path)
+    name = os.path.splitext(os.path.basename(path))[0]
+    if name in sys.modules and getattr(sys.modules[name], "__file__", None) == path:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def scene_classes(module) -> list[type]:
+    return [
+        cls for _, cls in inspect.getmembers(module, inspect.isclass)
+        if issubclass(cls, Scene) and cls.__module__ == module.__name__
+    ]
+
+class TexRequest:
+    def __init__(self, expression: str, environment: str | None, tex_template: TexTemplate):
+        self.expression = expression
+        self.environment = environment
+        self.tex_template = tex_template
+        self.tex_file = generate_tex_file(expression, environment, tex_template)
+        self.svg_file = self.tex_file.with_suffix(".svg")
+
+    def template_key(self):
+        template = self.tex_template
+        return ( template.tex_compiler, template.output_format, template.body, template.placeholder_text )
+
+    def page_code(self) -> str:
+        """The text the template's placeholder is replaced with."""
+        if self.environment is None:
+            return self.expression
+        code = self.tex_template.get_texcode_for_expression_in_env(self.expression, self.environment)
+        head, tail = self.tex_template.body.split(self.tex_template.placeholder_text)
+        return code[len(head):len(code) - len(tail)]
+
+def _placeholder_svg(glyph_count: int, directory: str) -> Path:
+    path = Path(directory) / f"placeholder_{glyph_count}.svg"
+    if not path.exists():
+        paths = "".join( f'<path d="M {i * 10} 0 h 8 v 8 h -8 z"/>' for i in range(glyph_count) )
+        path.write_text(
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{glyph_count * 10}" height="10">{paths}</svg>'
+        )
+    return path
+
+@contextmanager
+def recording(requests: dict[Path, TexRequest]):
+    """Replaces tex compilation with a recorder. Expressions that are already compiled load normally."""
+    placeholder_dir = tempfile.mkdtemp(prefix="prewarm_placeholders_")
+
+    def record(expression, environment=None, tex_template=None):
+        request = TexRequest(expression, environment, tex_template or config.tex_template)
+        if request.svg_file.exists():
+            return request.svg_file
+        requests.setdefault(request.svg_file, request)
+        glyph_count = max( 1, len(re.sub(r"\\[a-zA-Z]+|[\s{}^_&]", "", expression)) )
+        return _placeholder_svg(glyph_count, placeholder_dir)
+
+    original = tex_mobject.tex_to_svg_file
+    tex_mobject.tex_to_svg_file = record
+    try:
+        with texcache.disabled():
+            yield
+    finally:
+        tex_mobject.tex_to_svg_file = original
+        shutil.rmtree(placeholder_dir, ignore_errors=True)
+
+def _literal_call_sites(module):
+    """Yields (builder, args, kwargs) for tex builder calls whose arguments evaluate at module scope."""
+    tree = ast.parse(Path(module.__file__).read_text(encoding="utf-8"))
+    namespace = vars(module)
+
+    def evaluate(node):
+        return eval(compile(ast.Expression(node), module.__file__, "eval"), namespace)
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Name):
+            continue
+        if node.func.id not in TEX_BUILDERS or node.func.id not in namespace:
+            continue
+        try:
+            args = []
+            for arg in node.args:
+                if isinstance(arg, ast.Starred):
+                    args.extend(evaluate(arg.value))
+                else:
+                    args.append(evaluate(arg))
+            kwargs = {}
+            for keyword in node.keywords:
+                if keyword.arg is None:
+                    kwargs.update(evaluate(keyword.value))
+                else:
+                    kwargs[keyword.arg] = evaluate(keyword.value)
+        except Exception:
+            # Depends on local variables; the dry-run picks these up.
+            continue
+        yield namespace[node.func.id], args, kwargs
+
+def scan_static(module, requests: dict[Path, TexRequest]):
+    with recording(requests):
+        for builder, args, kwargs in _literal_call_sites(module):
+            try:
+                builder(*args, **kwargs)
+            except Exception:
+                pass
+
+def scan_dry_run(scene_class: type, requests: dict[Path, TexRequest]):
+    """Runs construct with every animation skipped and nothing written, recording tex as it goes."""
+    with recording(requests), tempconfig({ "dry_run": True, "save_last_frame": True, "renderer": "cairo" }):
+        try:
+            scene = scene_class()
+            scene.setup()
+            scene.construct()
+        except Exception as error:
+            # Placeholder glyphs can break index-based tex manipulation; whatever was recorded
+            # up to here is compiled and the next round gets further.
+            logger.debug(f"Dry-run of {scene_class.__name__} stopped early: {error!r}")
+
+def _multi_page_document(requests: list[TexRequest]) -> str:
+    template = requests[0].tex_template
+    head, tail = template.body.split(template.placeholder_text)
+    pages = "\n".join( f"\\begin{{{PAGE_ENVIRONMENT}}}\n{request.page_code()}\n\\end{{{PAGE_ENVIRONMENT}}}" for request in requests )
+    if "{standalone}" in head:
+        # standalone crops each page environment to its own page in multi mode.
+        head = head.replace("\\begin{document}", f"\\standaloneconfig{{multi={PAGE_ENVIRONMENT}}}\n\\begin{{document}}", 1)
+    else:
+        head = head.replace("\\begin{document}", f"\\newenvironment{{{PAGE_ENVIRONMENT}}}{{}}{{\\newpage}}\n\\begin{{document}}", 1)
+    return head + pages + tail
+
+def _compilation_command(tex_compiler: str, output_format: str, tex_file: str) -> list[str]:
+    """Arguments for manim's tex_compilation_command, writing next to tex_file in the working directory."""
+    if tex_compiler == "xelatex":
+        if output_format not in ( ".xdv", ".pdf" ):
+            raise ValueError("xelatex output is either pdf or xdv")
+        flags = [ "-no-pdf" ] if output_format == ".xdv" else []
+    else:
+        flags = [ f"-output-format={output_format[1:]}" ]
+    return [ tex_compiler, *flags, "-interaction=batchmode", "-halt-on-error", tex_file ]
+
+def _run(command: list[str], directory: Path) -> bool:
+    try:
+        result = subprocess.run(command, check=False, cwd=directory, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError as error:
+        logger.debug(f"Could not run {command[0]}: {error}")
+        return False
+    if result.returncode != 0:
+        logger.debug(f"{command[0]} exited with {result.returncode} in {directory}")
+    return result.returncode == 0
+
+def _compile_pages(requests: list[TexRequest], directory: Path) -> list[Path] | None:
+    """SVG pages of the batch document, in order, or None if latex or dvisvgm failed."""
+    template = requests[0].tex_template
+    tex_file = directory / "batch.tex"
+    tex_file.write_text(_multi_page_document(requests), encoding="utf-8")
+    if not _run(_compilation_command(template.tex_compiler, template.output_format, tex_file.name), directory):
+        return None
+    dvi_file = tex_file.with_suffix(template.output_format)
+    command = [
+        "dvisvgm", *( [ "--pdf" ] if template.output_format == ".pdf" else [] ),
+        "-p", "1-", dvi_file.name, "-n", "-v", "0", "-o", "page-%p.svg",
+    ]
+    if not _run(command, directory):
+        return None
+    return sorted( directory.glob("page-*.svg"), key=lambda page: int(re.findall(r"\d+", page.stem)[-1]) )
+
+def compile_singly(requests: list[TexRequest]):
+    for request in requests:
+        tex_to_svg_file(request.expression, request.environment, request.tex_template)
+
+def compile_batch(requests: list[TexRequest]):
+    """Typesets requests sharing one template in a single latex and dvisvgm run."""
+    directory = Path(tempfile.mkdtemp(prefix="prewarm_batch_"))
+    try:
+        pages = _compile_pages(requests, directory)
+        if pages is None or len(pages) != len(requests):
+            # A bad expression halts the whole batch and the pages can no longer be matched up,
+            # so compile this batch one expression at a time instead.
+            compile_singly(requests)
+            return
+        for page, request in zip(pages, requests):
+            os.replace(page, request.svg_file)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+def _same_geometry(svg_file: Path, other_svg_file: Path) -> bool:
+    shapes = [ SVGMobject(str(file), height=None, should_center=True) for file in ( svg_file, other_svg_file ) ]
+    points = [ shape.get_all_points() for shape in shapes ]
+    return points[0].shape == points[1].shape and np.allclose(points[0], points[1], atol=1e-3)
+
+def batch_matches_stock(requests: list[TexRequest]) -> bool:
+    """
+    Typesets requests with tex_to_svg_file and as one batch, and checks each page has the geometry
+    of its expression. The tex_to_svg_file output is kept.
+    """
+    compile_singly(requests)
+    directory = Path(tempfile.mkdtemp(prefix="prewarm_check_"))
+    try:
+        pages = _compile_pages(requests, directory)
+        if pages is None or len(pages) != len(requests):
+            return False
+        return all( _same_geometry(page, request.svg_file) for page, request in zip(pages, requests) )
+    except Exception as error:
+        logger.debug(f"Could not compare batched pages with tex_to_svg_file output: {error!r}")
+        return False
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+def compile_requests(requests: list[TexRequest], jobs: int | None = None, batch_size: int = 64):
+    jobs = jobs or os.cpu_count() or 1
+    groups = {}
+    for request in requests:
+        if not request.svg_file.exists():
+            groups.setdefault(request.template_key(), []).append(request)
+    work = []
+    for key, group in groups.items():
+        if key not in batching_verified:
+            # Checked on the main thread, ahead of the pool, since SVGMobject reads the global config.
+            sample, group = group[:2], group[2:]
+            if not group:
+                compile_singly(sample)
+                continue
+            batching_verified[key] = batch_matches_stock(sample)
+            if not batching_verified[key]:
+                logger.warning("Batched tex pages don't match tex_to_svg_file output; compiling one expression at a time")
+        if not batching_verified[key]:
+            work.extend( ( compile_singly, [ request ] ) for request in group )
+            continue
+        size = max( 1, min( batch_size, -(-len(group) // jobs) ) )
+        work.extend( ( compile_batch, group[i:i + size] ) for i in range(0, len(group), size) )
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        list(executor.map(lambda job: job[0](job[1]), work))
+
+def prewarm(paths: list[str], scene_names: list[str] | None = None, jobs: int | None = None, dry_run=True, max_rounds=5) -> int:
+    """Compiles all tex found in the given scene modules. Returns the number of expressions compiled."""
+    modules = [ load_module(path) for path in paths ]
+    scenes = [
+        cls for module in modules for cls in scene_classes(module)
+        if scene_names is None or cls.__name__ in scene_names
+    ]
+    requests = {}
+    for module in modules:
+        scan_static(module, requests)
+    compiled = 0
+    for index in range(max_rounds + 1):
+        if requests:
+            logger.info(f"Compiling {len(requests)} tex expressions")
+            compile_requests(list(requests.values()), jobs)
+            compiled += len(requests)
+        if not dry_run or index == max_rounds:
+            break
+        requests = {}
+        for scene in scenes:
+            scan_dry_run(scene, requests)
+        if not requests:
+            break
+    return compiled
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the tex used by scene modules ahead of rendering.")
+    parser.add_argument("files", nargs="+")
+    parser.add_argument("--scenes", nargs="*", help="Only dry-run these scenes.")
+    parser.add_argument("--jobs", type=int, default=None)
+    parser.add_argument("--static-only", action="store_true", help="Skip the dry-run pass.")
+    args = parser.parse_args()
+    count = prewarm(args.files, args.scenes, args.jobs, dry_run=not args.static_only)
+    print(f"Compiled {count} tex expressions.")
+
+if __name__ == "__main__":
+    main()
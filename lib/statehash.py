@@ -0,0 +1,73 @@
+"""
+Cheap fingerprints of what a mobject looks like, for detecting frames or layers that didn't change.
+
+Importing this module also gives every Mobject a `points_version`, a number that changes whenever
+its points are assigned, as set_points, shift, apply_function, become and the animations all do.
+Code writing into a points array in place calls touch_points afterwards.
+"""
+import itertools
+import zlib
+
+import numpy as np
+from manim import *
+
+# Everything the cairo camera reads when drawing a VMobject, besides its points.
+_drawn_attributes = [
+    "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas",
+    "stroke_width", "background_stroke_width",
+    "sheen_factor", "sheen_direction", "pixel_array",
+]
+
+_versions = itertools.count(1)
+
+class _VersionedPoints:
+    """Mobject.points, stamping each assignment. Without __get__, reads still come straight from the instance dict."""
+    def __set__(self, mobject, points):
+        mobject.__dict__["points"] = points
+        mobject.__dict__["points_version"] = next(_versions)
+
+Mobject.points = _VersionedPoints()
+
+def touch_points(*mobjects: Mobject):
+    """Gives mobjects new points versions, after their points were written in place."""
+    for mobject in mobjects:
+        mobject.__dict__["points_version"] = next(_versions)
+
+def points_version(mobject: Mobject):
+    """mobject's points_version, or a checksum of its points if it has none, e.g. an OpenGLMobject."""
+    version = mobject.__dict__.get("points_version")
+    return points_fingerprint(mobject) if version is None else version
+
+def _value_fingerprint(value):
+    if isinstance(value, np.ndarray):
+        return ( value.shape, zlib.crc32(np.ascontiguousarray(value)) )
+    return value
+
+def mobject_fingerprint(mobject: Mobject) -> tuple:
+    """Identity plus checksums of points and style. Submobjects are not included."""
+    return (
+        id(mobject),
+        _value_fingerprint(mobject.points),
+        *( _value_fingerprint(getattr(mobject, attribute)) for attribute in _drawn_attributes if hasattr(mobject, attribute) ),
+    )
+
+def points_fingerprint(mobject: Mobject) -> tuple:
+    """Checksum of the points of mobject alone."""
+    return _value_fingerprint(mobject.points)
+
+def points_stamp(*mobjects: Mobject) -> tuple:
+    """Version stamp of the geometry of mobjects and their families. Equal stamps mean nothing moved."""
+    return tuple(
+        ( id(submob), points_version(submob) )
+        for mobject in mobjects for submob in mobject.get_family()
+    )
+
+def camera_fingerprint(camera: Camera) -> tuple:
+    return (
+        camera.pixel_width, camera.pixel_height,
+        camera.frame_width, camera.frame_height,
+        tuple(camera.frame_center),
+        id(camera.background),
+        # phi, theta, gamma, focal distance and zoom of a ThreeDCamera.
+        *( tracker.get_value() for tracker in getattr(camera, "get_value_trackers", list)() ),
+    )
@@ -0,0 +1,167 @@
+"""
+Persistent cache of finished tex mobjects.
+
+Entries are keyed by a hash of everything that affects the result (tex strings, template,
+split arguments, color map, manim version) and store the pickled mobject, so a hit skips
+LaTeX, SVG parsing and Bezier conversion entirely. Files are written atomically, so several
+render processes can share the cache. Hits refresh a file's mtime and the oldest files are
+evicted once the cache grows past its size cap, down to 90% of it. Each process keeps a running
+total of what it stores, so the directory is only scanned on the first store and when that total
+crosses the cap. With the cache off, entries are kept in memory for the process instead. Either
+way each entry is kept in one place, and every lookup hands out a mobject of its own. Hits and
+misses are counted per kind of entry in `stats`.
+
+Configure with the environment variables:
+```
+MANIM_TEX_GEOMETRY_CACHE     cache directory, or "off" to keep entries in memory only (default: <media_dir>/tex_geometry)
+MANIM_TEX_GEOMETRY_CACHE_MB  size cap in megabytes (default: 512)
+```
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+from contextlib import contextmanager
+from typing import Callable
+
+import manim
+from manim import *
+
+_disabled = 0
+# Entries of this process while the cache directory is off.
+_memory = {}
+# Kind of entry, the first of its key parts -> [hits, misses]
+stats: dict[str, list[int]] = {}
+# Bytes in each cache directory as of its last scan, plus what this process has stored there since.
+_sizes = {}
+# Eviction leaves this fraction of the cap, so the next scan is that far off.
+EVICT_TO = 0.9
+
+@contextmanager
+def disabled():
+    """Bypasses the cache, e.g. while building throwaway mobjects that must not be stored."""
+    global _disabled
+    _disabled += 1
+    try:
+        yield
+    finally:
+        _disabled -= 1
+
+def bypassed() -> bool:
+    return _disabled > 0
+
+def cache_dir() -> str | None:
+    if bypassed():
+        return None
+    return _configured_dir()
+
+def _configured_dir() -> str | None:
+    path = os.environ.get("MANIM_TEX_GEOMETRY_CACHE", os.path.join(config.media_dir, "tex_geometry"))
+    if path.lower() == "off":
+        return None
+    return path
+
+def max_cache_bytes() -> int:
+    return int(float(os.environ.get("MANIM_TEX_GEOMETRY_CACHE_MB", 512)) * 1024 * 1024)
+
+def _key_repr(value) -> str:
+    """repr with dicts sorted and tex templates reduced to their source, so equal inputs hash equally."""
+    if isinstance(value, TexTemplate):
+        return f"TexTemplate({value.tex_compiler!r}, {value.output_format!r}, {value.body!r})"
+    if isinstance(value, dict):
+        items = sorted( ( _key_repr(k), _key_repr(v) ) for k, v in value.items() )
+        return "{" + ", ".join( f"{k}: {v}" for k, v in items ) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join( _key_repr(v) for v in value ) + "]"
+    return repr(value)
+
+def cache_key(*parts) -> str:
+    hasher = hashlib.sha256()
+    hasher.update( _key_repr( [ manim.__version__, *parts ] ).encode() )
+    return hasher.hexdigest()
+
+def _entry_path(key: str) -> str:
+    return os.path.join( cache_dir(), key + ".pickle" )
+
+def load(key: str) -> Mobject | None:
+    path = _entry_path(key)
+    try:
+        with open(path, "rb") as file:
+            result = pickle.load(file)
+        os.utime(path)
+        return result
+    except (OSError, EOFError, pickle.UnpicklingError):
+        # Missing, evicted by another process mid-read, or truncated. Treat all as a miss.
+        return None
+
+def store(key: str, mobject: Mobject):
+    directory = cache_dir()
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            pickle.dump(mobject, file, protocol=pickle.HIGHEST_PROTOCOL)
+            size = file.tell()
+        os.replace(temp_path, _entry_path(key))
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    if directory in _sizes and _sizes[directory] + size <= max_cache_bytes():
+        _sizes[directory] += size
+    else:
+        evict()
+
+def evict(max_bytes: int | None = None):
+    """Removes least recently used entries, once the cache is past max_bytes, until it fits in EVICT_TO of it."""
+    if max_bytes is None:
+        max_bytes = max_cache_bytes()
+    directory = cache_dir()
+    entries = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            if not entry.name.endswith(".pickle"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append( ( stat.st_mtime, stat.st_size, entry.path ) )
+    total = sum( size for _, size, _ in entries )
+    if total > max_bytes:
+        for _, size, path in sorted(entries):
+            if total <= EVICT_TO * max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+    _sizes[directory] = total
+
+def cached_tex(key_parts: tuple, build: Callable[[], Mobject]) -> Mobject:
+    """Returns build(), loading it from the cache when an entry for key_parts exists."""
+    if bypassed():
+        return build()
+    key = cache_key(*key_parts)
+    counts = stats.setdefault(key_parts[0], [ 0, 0 ])
+    if _configured_dir() is None:
+        result = _memory.get(key)
+        counts[result is None] += 1
+        if result is None:
+            result = _memory[key] = build()
+        return result.copy()
+    result = load(key)
+    counts[result is None] += 1
+    if result is None:
+        result = build()
+        store(key, result)
+    return result
+
+def cached_math_tex(*tex_strings, **kwargs) -> MathTex:
+    """MathTex, but cached."""
+    template = kwargs.get("tex_template", config.tex_template)
+    return cached_tex(
+        ( "MathTex", tex_strings, kwargs, template ),
+        lambda: MathTex(*tex_strings, **kwargs)
+    )
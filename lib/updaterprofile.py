@@ -0,0 +1,155 @@
+"""
+Opt-in profiler that times every mobject updater call and attributes it to the updater's source.
+
+Updaters are grouped by file:line of the function that does the work. Wrappers are looked
+through: always_redraw's lambda is attributed to the function passed to always_redraw, and
+anything setting `__wrapped__` (like always_redraw_instanced) to what it wraps. When a scene
+finishes rendering, a ranked report is printed, and optionally the samples are written as
+folded stacks (`scene;mobject type;location microseconds`), which flamegraph.pl, speedscope and
+inferno read directly.
+
+Enable with the environment variables:
+```
+MANIM_PROFILE_UPDATERS         set to 1 to profile
+MANIM_PROFILE_UPDATERS_FOLDED  file to write folded stacks to; "{scene}" is replaced by the scene name
+```
+"""
+import inspect
+import os
+import time
+import weakref
+
+import manim
+from manim import *
+from manim.mobject.opengl.opengl_mobject import OpenGLMobject
+
+_manim_root = os.path.dirname(os.path.abspath(manim.__file__))
+
+# (scene, mobject type, location) -> [calls, seconds]
+samples: dict[tuple[str, str, str], list] = {}
+_current_scene = "?"
+_installed = False
+
+def _is_manim_code(function) -> bool:
+    code = getattr(function, "__code__", None)
+    return code is None or os.path.abspath(code.co_filename).startswith(_manim_root)
+
+def _user_function(updater):
+    """Looks through wrappers and manim's own lambdas, like always_redraw's, to the function doing the work."""
+    function = inspect.unwrap(updater)
+    for _ in range(8):
+        if not _is_manim_code(function):
+            break
+        inner = [
+            cell.cell_contents for cell in (getattr(function, "__closure__", None) or ())
+            if callable(getattr(cell, "cell_contents", None)) and hasattr(cell.cell_contents, "__code__")
+        ]
+        if not inner:
+            break
+        function = inspect.unwrap(inner[0])
+    return function
+
+# Keyed by the updater itself: always_redraw's updaters all share one __code__.
+_locations = weakref.WeakKeyDictionary()
+
+def _location(updater) -> str:
+    function = _user_function(updater)
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return repr(function)
+    path = os.path.relpath(code.co_filename)
+    return f"{path}:{code.co_firstlineno} ({code.co_name})"
+
+def updater_location(updater) -> str:
+    try:
+        location = _locations.get(updater)
+    except TypeError:
+        # Not weak-referenceable, e.g. a builtin.
+        return _location(updater)
+    if location is None:
+        location = _locations[updater] = _location(updater)
+    return location
+
+def _call_timed(mobject, updater, *args):
+    start = time.perf_counter()
+    updater(mobject, *args)
+    elapsed = time.perf_counter() - start
+    sample = samples.setdefault( ( _current_scene, type(mobject).__name__, updater_location(updater) ), [ 0, 0.0 ] )
+    sample[0] += 1
+    sample[1] += elapsed
+
+def _profiled_update(self, dt: float = 0, recursive: bool = True):
+    # Same as Mobject.update, with each updater call timed.
+    if self.updating_suspended:
+        return self
+    for updater in self.updaters:
+        if "dt" in inspect.signature(updater).parameters:
+            _call_timed(self, updater, dt)
+        else:
+            _call_timed(self, updater)
+    if recursive:
+        for submob in self.submobjects:
+            submob.update(dt, recursive)
+    return self
+
+def _profiled_opengl_update(self, dt: float = 0, recurse: bool = True):
+    # Same as OpenGLMobject.update, with each updater call timed.
+    if not self.has_updaters or self.updating_suspended:
+        return self
+    for updater in self.time_based_updaters:
+        _call_timed(self, updater, dt)
+    for updater in self.non_time_updaters:
+        _call_timed(self, updater)
+    if recurse:
+        for submob in self.submobjects:
+            submob.update(dt, recurse)
+    return self
+
+def report(scene_name: str | None = None, limit: int = 25) -> str:
+    by_location = {}
+    for ( scene, _, location ), ( calls, seconds ) in samples.items():
+        if scene_name is None or scene == scene_name:
+            entry = by_location.setdefault(location, [ 0, 0.0 ])
+            entry[0] += calls
+            entry[1] += seconds
+    total = sum( seconds for _, seconds in by_location.values() ) or 1
+    ranked = sorted( by_location.items(), key=lambda item: -item[1][1] )
+    lines = [ f"{'updater':<60} {'calls':>8} {'total (ms)':>11} {'mean (us)':>10} {'share':>6}" ]
+    for location, ( calls, seconds ) in ranked[:limit]:
+        lines.append(f"{location:<60} {calls:>8} {seconds * 1e3:>11.1f} {seconds / calls * 1e6:>10.1f} {seconds / total:>6.1%}")
+    return "\n".join(lines)
+
+def write_folded(path: str, scene_name: str | None = None):
+    with open(path, "w") as file:
+        for ( scene, mobject_type, location ), ( _, seconds ) in samples.items():
+            if scene_name is None or scene == scene_name:
+                file.write(f"{scene};{mobject_type};{location} {max( 1, round(seconds * 1e6) )}\n")
+
+def install():
+    """Patches Mobject.update and OpenGLMobject.update to time updaters, and Scene.render to report at the end of each scene."""
+    global _installed
+    if _installed:
+        return
+    _installed = True
+    Mobject.update = _profiled_update
+    OpenGLMobject.update = _profiled_opengl_update
+    render = Scene.render
+
+    def profiled_render(self, *args, **kwargs):
+        global _current_scene
+        _current_scene = type(self).__name__
+        try:
+            return render(self, *args, **kwargs)
+        finally:
+            print(f"\nUpdater profile for {_current_scene}:\n{report(_current_scene)}")
+            folded = os.environ.get("MANIM_PROFILE_UPDATERS_FOLDED")
+            if folded:
+                path = folded.replace("{scene}", _current_scene)
+                write_folded(path, _current_scene)
+                print(f"Folded stacks written to {path}")
+
+    Scene.render = profiled_render
+
+def install_from_env():
+    if os.environ.get("MANIM_PROFILE_UPDATERS", "").lower() not in ( "", "0", "off" ):
+        install()
@@ -1,14 +1,20 @@
+from functools import lru_cache
 from typing import Callable, Iterable, Tuple
 from manim import *
 import re
 
+from lib.arclength import CachedMoveAlongPath, point_from_proportion
+from lib.geometry import angle_midpoints
+from lib import texcache
+from lib.texcache import cached_math_tex, cached_tex
+
 def animate_replace_tex(tex: MathTex, text_or_tex: str | MathTex, tex_to_color_map=None, aligned_edge=LEFT):
     if isinstance(text_or_tex, str):
-        text_or_tex = MathTex( text_or_tex, tex_to_color_map=tex_to_color_map )
+        text_or_tex = cached_math_tex( text_or_tex, tex_to_color_map=tex_to_color_map )
     return tex.animate.become( text_or_tex.move_to(tex, aligned_edge) )
 
 def animate_arc_to(mobj, target):
-    return MoveAlongPath( mobj, ArcBetweenPoints( mobj.get_center(), target.get_center() ) )
+    return CachedMoveAlongPath( mobj, ArcBetweenPoints( mobj.get_center(), target.get_center() ) )
 
 def tex_matches(tex: MathTex, *parts):
     matches = [ tex.get_part_by_tex(part) for part in parts ]
@@ -16,32 +22,73 @@ def tex_matches(tex: MathTex, *parts):
     return VGroup(*not_none)
 
 def angle_label_pos(line1, line2, radius, **kwargs):
-    return Angle( line1, line2, radius=radius, **kwargs).point_from_proportion(0.5)
+    if kwargs.get("elbow"):
+        return point_from_proportion(Angle( line1, line2, radius=radius, **kwargs), 0.5)
+    return angle_midpoints(line1.get_start(), line1.get_end(), line2.get_start(), line2.get_end(), radius, **kwargs)
+
+@lru_cache(maxsize=None)
+def _color_split_pattern(keys: Tuple[str, ...]) -> re.Pattern:
+    word_patterns = [
+        f"(?<!\w)({re.escape(pattern)})(?!\w)"
+        for pattern in keys
+    ]
+    return re.compile("|".join(word_patterns))
+
+def colored_math_tex_cache_info() -> dict[str, int]:
+    """Hit/miss counters for colored_math_tex's results, kept by texcache, and its split pattern cache."""
+    hits, misses = texcache.stats.get("colored_math_tex", [ 0, 0 ])
+    pattern_info = _color_split_pattern.cache_info()
+    return {
+        "hits": hits,
+        "misses": misses,
+        "pattern_hits": pattern_info.hits,
+        "pattern_misses": pattern_info.misses,
+    }
+
+def log_tex_cache_stats(scene_name: str):
+    for kind, ( hits, misses ) in sorted(texcache.stats.items()):
+        logger.debug(f"{scene_name}: {kind} cache {hits} hits, {misses} misses so far")
+    pattern_info = _color_split_pattern.cache_info()
+    logger.debug(f"{scene_name}: colored_math_tex split patterns {pattern_info.hits} hits, {pattern_info.misses} misses so far")
+
+_logging_installed = False
+
+def install_tex_cache_logging():
+    """Patches Scene.tear_down to log the tex cache counters at debug level when each scene finishes."""
+    global _logging_installed
+    if _logging_installed:
+        return
+    _logging_installed = True
+    tear_down = Scene.tear_down
+
+    def logging_tear_down(self):
+        tear_down(self)
+        log_tex_cache_stats(type(self).__name__)
+
+    Scene.tear_down = logging_tear_down
 
 def colored_math_tex(*tex_strings, t2c:dict[str, str]={}, **kwargs):
-    """MathTex, but with better coloring behaviour."""
+    """MathTex, but with better coloring behaviour.
+    Results are cached by texcache per (tex_strings, t2c, kwargs), each call returns a mobject of its own."""
 
     def get_tex_strings():
-        keys = t2c.keys()
+        keys = tuple(t2c.keys())
         if len(keys) == 0:
             return tex_strings
-        word_patterns = [
-            f"(?<!\w)({re.escape(pattern)})(?!\w)"
-            for pattern in keys
-        ]
-        pattern = "|".join(word_patterns)
+        pattern = _color_split_pattern(keys)
         result = []
         for s in tex_strings:
-            result.extend(re.split(pattern, s))
+            result.extend(pattern.split(s))
         result = [piece for piece in result if piece and len(piece.strip(" ")) > 0]
         return result
 
-    tex_strings = get_tex_strings()
-    # print(tex_strings)
+    def build():
+        result = MathTex(*get_tex_strings(), **kwargs)
+        result.set_color_by_tex_to_color_map(t2c, substring=False)
+        return result
 
-    result = MathTex(*tex_strings, **kwargs)
-    result.set_color_by_tex_to_color_map(t2c, substring=False)
-    return result
+    template = kwargs.get("tex_template", config.tex_template)
+    return cached_tex( ("colored_math_tex", tex_strings, t2c, kwargs, template), build )
 
 def compose_colored_tex(*color_tex: str, **kwargs):
     """Builds MathTex with colored tex. Argument has form color1, tex1, color2, tex2..."""
@@ -55,12 +102,14 @@ def compose_colored_tex(*color_tex: str, **kwargs):
         colors.append(color_tex[i * 2 + 0])
         texes.append( color_tex[i * 2 + 1])
     
-    tex = MathTex(*texes, **kwargs)
+    def build():
+        tex = MathTex(*texes, **kwargs)
+        for i in range(entry_count):
+            tex[i].set_color(colors[i])
+        return tex
 
-    for i in range(entry_count):
-        tex[i].set_color(colors[i])
-    
-    return tex
+    template = kwargs.get("tex_template", config.tex_template)
+    return cached_tex( ("compose_colored_tex", color_tex, kwargs, template), build )
 
 def play_rewrite_sequence(
         scene: Scene, *steps: Tuple[MathTex, bool], key_map: dict[str, str] = {},
@@ -6,8 +6,24 @@ from complex import AlgebraicProps
 from lib.mathutils import relative_quaternion2, smoothstep
 import numpy as np
 
-from lib.utils import animate_replace_tex, colored_math_tex, compose_colored_tex, play_rewrite_sequence, tex_matches
+from lib.utils import animate_replace_tex, colored_math_tex, compose_colored_tex, install_tex_cache_logging, play_rewrite_sequence, tex_matches
+from lib.arclength import point_from_proportion
+from lib.CachedMathTable import CachedMathTable
+from lib.CheckpointScene import CheckpointMixin
+from lib.DedupCairoRenderer import DedupCairoRenderer
+from lib.FrameParallelScene import FrameParallelMixin
+from lib.FusedTransformScene import FusedTransformMixin
+from lib.HeadlessOpenGLRenderer import HeadlessOpenGLMixin
+from lib.InstancedRedraw import always_redraw_instanced
 from lib.LabeledArrow import LabeledArrow
+from lib.lod import lod_arrow3d
+from lib.MatrixRotate import MatrixRotate
+from lib.QuaternionRotate import CameraPath
+from lib.texcache import cached_math_tex
+from lib import updaterprofile
+
+updaterprofile.install_from_env()
+install_tex_cache_logging()
 
 SurfaceClass = OpenGLSurface if config.renderer == "opengl" else Surface
 
@@ -33,7 +49,7 @@ color_map = {
 }
 
 def math_tex(*args, **kwargs):
-    return MathTex(*args, tex_to_color_map=color_map, **kwargs)
+    return cached_math_tex(*args, tex_to_color_map=color_map, **kwargs)
 
 def replace_tex(tex, text, **kwargs):
     return animate_replace_tex(tex, text, tex_to_color_map=color_map, **kwargs)
@@ -48,10 +64,10 @@ def vec_cross_table(tex_to_color_map=None):
         [jh, km,  0, ih],
         [kh, jh, im,  0]
     ]
-    return MathTable(
+    return CachedMathTable(
         crossproduct_table,
         include_outer_lines=True,
-        element_to_mobject=lambda s: MathTex(s, tex_to_color_map=tex_to_color_map)
+        element_to_mobject_config={ "tex_to_color_map": tex_to_color_map }
     )
 
 def vec_dot_table(tex_to_color_map=None):
@@ -63,10 +79,10 @@ def vec_dot_table(tex_to_color_map=None):
         [jh,  0,  1,  0],
         [kh,  0,  0,  1]
     ]
-    return MathTable(
+    return CachedMathTable(
         dot_product_table,
         include_outer_lines=True,
-        element_to_mobject=lambda s: MathTex(s, tex_to_color_map=tex_to_color_map)
+        element_to_mobject_config={ "tex_to_color_map": tex_to_color_map }
     )
 
 def pure_quat_times_table(tex_to_color_map=None):
@@ -77,10 +93,10 @@ def pure_quat_times_table(tex_to_color_map=None):
         ["j", "-k", "-1",  "i"],
         ["k",  "j", "-i", "-1"]
     ]
-    return MathTable(
+    return CachedMathTable(
         quaternion_table_ijk,
         include_outer_lines=True,
-        element_to_mobject=lambda s: MathTex(s, tex_to_color_map=tex_to_color_map)
+        element_to_mobject_config={ "tex_to_color_map": tex_to_color_map }
     )
 
 def quat_times_table(tex_to_color_map=None):
@@ -91,13 +107,18 @@ def quat_times_table(tex_to_color_map=None):
         ["j", "j", "-k", "-1",  "i"],
         ["k", "k",  "j", "-i", "-1"]
     ]
-    return MathTable(
+    return CachedMathTable(
         quaternion_table,
         include_outer_lines=True,
-        element_to_mobject=lambda s: MathTex(s, tex_to_color_map=tex_to_color_map),
+        element_to_mobject_config={ "tex_to_color_map": tex_to_color_map },
     )
 
 class QuatDefinition(Scene):
+    def __init__(self, renderer=None, skip_animations=False, **kwargs):
+        if renderer is None and config.renderer == RendererType.CAIRO:
+            renderer = DedupCairoRenderer(skip_animations=skip_animations)
+        super().__init__(renderer=renderer, skip_animations=skip_animations, **kwargs)
+
     def construct(self):
         _color_map = color_map | { "{i}": RED, "+":WHITE }
         tex_kw = { "t2c":_color_map }
@@ -251,7 +272,7 @@ class TableDerivation(Scene):
         play_product_derivation("j", "k", "i", 2, 0)
         play_product_derivation("k", "i", "j", 0, 1)
 
-class ThreeD(ThreeDScene):
+class ThreeD(HeadlessOpenGLMixin, FusedTransformMixin, FrameParallelMixin, ThreeDScene):
     def construct(self):
         if config.renderer == "opengl":
             self.set_camera_orientation(phi=65*DEGREES, theta=110*DEGREES)
@@ -264,9 +285,9 @@ class ThreeD(ThreeDScene):
         self.add(numplane)
         self.add(axes)
 
-        arrow_i = Arrow3D(ORIGIN, vi, color=RED)
-        arrow_j = Arrow3D(ORIGIN, vj, color=GREEN)
-        arrow_k = Arrow3D(ORIGIN, vk, color=BLUE)
+        arrow_i = lod_arrow3d(ORIGIN, vi, color=RED)
+        arrow_j = lod_arrow3d(ORIGIN, vj, color=GREEN)
+        arrow_k = lod_arrow3d(ORIGIN, vk, color=BLUE)
 
         label_dist = 1.25
         tex_i = math_tex("i").move_to(vi * label_dist).set_stroke(BLACK, 5, 1, True)
@@ -334,7 +355,7 @@ class ThreeD(ThreeDScene):
             self.add(*arrows_jk_2)
             self.play( 
                 *[ Rotate( arrow, angle, vi, ORIGIN ) for arrow in arrows_jk_2 ],
-                Rotate(numplane, angle, vi),
+                MatrixRotate(numplane, angle, vi),
                 indicate_arrow(arrow_i, tex_i), run_time=2 )
             self.play( FadeOut(*arrows_jk_2) )
 
@@ -355,7 +376,7 @@ class ThreeD(ThreeDScene):
 
         self.wait()
 
-class ThreeDPart2(ThreeDScene):
+class ThreeDPart2(HeadlessOpenGLMixin, ThreeDScene):
     def construct(self):
         self.set_camera_orientation(phi=65*DEGREES, theta=110*DEGREES)
 
@@ -365,9 +386,9 @@ class ThreeDPart2(ThreeDScene):
         axes = ThreeDAxes(x_range=[-5, 5], y_range=[-5, 5], z_range=[-5, 5], x_length=10, y_length=10, z_length=10)
         self.add(axes)
 
-        arrow_i = Arrow3D(ORIGIN, vi, color=RED)
-        arrow_j = Arrow3D(ORIGIN, vj, color=GREEN)
-        arrow_k = Arrow3D(ORIGIN, vk, color=BLUE)
+        arrow_i = lod_arrow3d(ORIGIN, vi, color=RED)
+        arrow_j = lod_arrow3d(ORIGIN, vj, color=GREEN)
+        arrow_k = lod_arrow3d(ORIGIN, vk, color=BLUE)
         self.add(arrow_i, arrow_j, arrow_k)
 
         label_dist = 1.25
@@ -393,23 +414,23 @@ class ThreeDPart2(ThreeDScene):
 
         def animate_rotation(theta_label, angle):
             theta_tracker = ValueTracker(0)
-            def get_angle():
+            def get_angle(make):
                 theta = theta_tracker.get_value()
                 sign = np.sign(theta)
                 if abs(theta) < 0.001:
                     return VGroup()
-                angle = Angle(
-                    Line(ORIGIN, UP),
-                    Line(ORIGIN, UP).rotate(theta, about_point=ORIGIN),
+                angle = make(Angle,
+                    make(Line, ORIGIN, UP),
+                    make(Line, ORIGIN, UP).rotate(theta, about_point=ORIGIN),
                     other_angle=sign<0
                 ).rotate(PI/2, vj, ORIGIN)
-                midpoint = angle.get_midpoint()
+                midpoint = point_from_proportion(angle, 0.5)
                 opacity = smoothstep(0, 20*DEGREES, abs(theta))
-                label = MathTex(theta_label).next_to(midpoint + OUT * 0.1 * sign, normalize(midpoint), buff=0.1)
+                label = make(MathTex, theta_label).next_to(midpoint + OUT * 0.1 * sign, normalize(midpoint), buff=0.1)
                 label.set_opacity(opacity).scale(0.75)
                 label.fix_orientation()
                 return VGroup(angle, label)
-            mobj_angle = always_redraw(get_angle)
+            mobj_angle = always_redraw_instanced(get_angle)
             self.add(mobj_angle)
 
             arrow_j_copy = arrow_j.copy()
@@ -418,7 +439,7 @@ class ThreeDPart2(ThreeDScene):
             
             self.play(
                 Rotate(rotation_group, angle, vi, ORIGIN),
-                Rotate(numplane, angle, vi, ORIGIN),
+                MatrixRotate(numplane, angle, vi, ORIGIN),
                 theta_tracker.animate.increment_value(angle)
             )
             self.wait()
@@ -451,17 +472,17 @@ class ThreeDPart2(ThreeDScene):
         self.play(FadeOut(left_group, right_group, tex_rotor))
 
         # Show issue with rotation outside of jk-plane
-        arrow_v = Arrow3D(ORIGIN, vj + vk)
+        arrow_v = lod_arrow3d(ORIGIN, vj + vk)
         self.play(FadeIn(arrow_v))
         self.play(Indicate(numplane, 1.1))
 
-        self.move_camera(phi=75*DEGREES, theta=145*DEGREES)
+        self.play(CameraPath(self.camera, ( 75*DEGREES, 145*DEGREES )))
 
-        arrow_v_i = Arrow3D(ORIGIN, vi, color=RED).shift(vj + vk)
+        arrow_v_i = lod_arrow3d(ORIGIN, vi, color=RED).shift(vj + vk)
         self.play(
             # FadeIn(arrow_v_i),
             GrowFromPoint(arrow_v_i, vj + vk),
-            arrow_v.animate.become(Arrow3D(ORIGIN, vj + vk + vi))
+            arrow_v.animate.become(lod_arrow3d(ORIGIN, vj + vk + vi))
         )
         self.wait()
 
@@ -496,7 +517,7 @@ class ThreeDPart2(ThreeDScene):
         self.play(Create(rect))
         self.wait()
 
-class DualPlanes(Scene):
+class DualPlanes(FusedTransformMixin, CheckpointMixin, Scene):
     def construct(self):
 
         def make_plane(x_color, y_color, x_label, y_label ):
@@ -547,6 +568,8 @@ class DualPlanes(Scene):
 
         self.wait()
         
+        self.checkpoint("components")
+
         # Complex and jk components of v.
         c45 = np.cos(45 * DEGREES)
         arrow_ab, arrow_cd = [
@@ -602,6 +625,8 @@ class DualPlanes(Scene):
         add_angle(arrow_cd, arrow_icd, False)
         add_angle(arrow_cd, arrow_cdi, True)
 
+        self.checkpoint("multiply")
+
         # Multiply complex-componet on either side.
         self.play( Rotate(arrow_iab.arrow, theta, about_point=origin_ab),
             replace_tex(arrow_iab.label, math_tex("qv").scale(plane_scale) ) )
@@ -634,6 +659,8 @@ class DualPlanes(Scene):
 
         self.wait()
 
+        self.checkpoint("sandwich")
+
         tex_sandwich_1 = math_tex("qvq").to_edge(UP)
         tex_sandwich_2 = math_tex("qv\\overline{q}").next_to(tex_sandwich_1, DOWN)
         self.play( Write( tex_sandwich_1 ) )
@@ -697,6 +724,8 @@ class DualPlanes(Scene):
         )
         self.wait()
 
+        self.checkpoint("conjugate_sandwich")
+
         label = "qv\\overline{q}"
         sandwich1 = animate_sandwich(arrow_ab, plane_1i, label, angle, True)
         self.wait()
@@ -745,7 +774,7 @@ class Generalizing(Scene):
         def get_permute(r):
             epsilon = 0.05/r
             circle = Circle(r)
-            pfp = lambda p: circle.point_from_proportion(p)
+            pfp = lambda p: point_from_proportion(circle, p)
             get_arrow = lambda p: CurvedArrow(pfp(p+epsilon), pfp(p+1/3-epsilon), radius=r+r/15, tip_length=r/5)
             return VGroup(
                 math_tex("i").move_to(pfp(0/3)),
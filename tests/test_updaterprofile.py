@@ -0,0 +1,53 @@
+from manim import *
+from manim.mobject.opengl.opengl_mobject import OpenGLMobject
+
+from lib import updaterprofile
+from lib.InstancedRedraw import always_redraw_instanced
+from lib.updaterprofile import updater_location
+
+def make_dot():
+    return Dot()
+
+def make_square():
+    return Square()
+
+def test_always_redraw_updaters_keep_their_own_locations():
+    dot, square = always_redraw(make_dot), always_redraw(make_square)
+    dot_location = updater_location(dot.updaters[0])
+    square_location = updater_location(square.updaters[0])
+    assert "make_dot" in dot_location
+    assert "make_square" in square_location
+
+def make_dot_instanced(make):
+    return make(Dot)
+
+def make_square_instanced(make):
+    return make(Square)
+
+def test_always_redraw_instanced_updaters_keep_their_own_locations():
+    dot, square = always_redraw_instanced(make_dot_instanced), always_redraw_instanced(make_square_instanced)
+    assert "make_dot_instanced" in updater_location(dot.updaters[0])
+    assert "make_square_instanced" in updater_location(square.updaters[0])
+
+def shift_up(mob, dt):
+    mob.shift(dt * UP)
+
+def keep_centered(mob):
+    mob.move_to(ORIGIN)
+
+def test_opengl_mobject_updaters_are_profiled(monkeypatch):
+    # install() patches classes for good, so let monkeypatch put them back.
+    for cls in ( Mobject, OpenGLMobject ):
+        monkeypatch.setattr(cls, "update", cls.update)
+    monkeypatch.setattr(Scene, "render", Scene.render)
+    monkeypatch.setattr(updaterprofile, "_installed", False)
+    monkeypatch.setattr(updaterprofile, "samples", {})
+    updaterprofile.install()
+
+    mob = OpenGLMobject()
+    mob.add_updater(shift_up)
+    mob.add_updater(keep_centered)
+    mob.update(0.5)
+    mob.update(0.5)
+    calls = { location.split(" ")[-1]: sample[0] for ( _, _, location ), sample in updaterprofile.samples.items() }
+    assert calls == { "(shift_up)": 2, "(keep_centered)": 2 }